@@ -3,7 +3,7 @@ import numpy as np
 from PyQt5 import QtCore, QtWidgets
 
 import matplotlib.ticker as ticker
-from pylab import Figure
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
 
 
@@ -44,7 +44,6 @@ class DunnMatrixDialog(QtWidgets.QDialog):
         self._canvas = FigureCanvasQTAgg(self._figure)
         self._toolbar = NavigationToolbar2QT(self._canvas, self)
 
-        self._axes.clear()
         plot = self._axes.imshow(self._dunn_matrix, aspect='equal', origin='lower', interpolation='nearest')
         self._axes.set_xticks(range(0, self._dunn_matrix.shape[0]))
         self._axes.set_yticks(range(0, self._dunn_matrix.shape[1]))
@@ -52,17 +51,14 @@ class DunnMatrixDialog(QtWidgets.QDialog):
         self._axes.set_yticklabels(self._dunn_matrix.index)
         loc = ticker.MaxNLocator(10)
         self._axes.xaxis.set_major_locator(loc)
-        for tick in self._axes.xaxis.get_major_ticks():
-            tick.label.set_fontsize(8)
-            tick.label.set_rotation('vertical')
-
         self._axes.yaxis.set_major_locator(loc)
-        for tick in self._axes.yaxis.get_major_ticks():
-            tick.label.set_fontsize(8)
+        self._axes.tick_params(axis='x', labelsize=8, labelrotation=90)
+        self._axes.tick_params(axis='y', labelsize=8)
 
         self._figure.colorbar(plot)
 
-        self._canvas.draw()
+        # The figure is rendered once when the dialog is painted for the first time
+        self._canvas.draw_idle()
 
     def init_ui(self):
         """Initialiwes the dialog.
@@ -1,9 +1,12 @@
 import logging
 
-from PyQt5 import QtCore, QtWidgets
+import numpy as np
+
+from PyQt5 import QtWidgets
 
 import matplotlib.ticker as ticker
-from pylab import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 
 from inspigtor.gui.utils.helper_functions import find_main_window, func_formatter
@@ -31,6 +34,7 @@ class GroupAveragesDialog(QtWidgets.QDialog):
         """
 
         self._selected_group_combo.currentIndexChanged.connect(self.on_select_group)
+        self._canvas.mpl_connect('draw_event', self.on_draw)
 
     def build_layout(self):
         """Build the layout.
@@ -47,6 +51,63 @@ class GroupAveragesDialog(QtWidgets.QDialog):
 
         self.setLayout(main_layout)
 
+    def build_plots(self):
+        """Plot the averages and standard deviations over record intervals for all the groups.
+
+        The plots of the groups are built once, their visibility being toggled when a group is selected.
+        """
+
+        self._group_plots = []
+
+        # The ends of the error bars of all the groups, used to set the limits of the axes
+        errorbars_ends = []
+
+        n_intervals = 0
+        for group_id, group in enumerate(self._groups_model.group_names):
+
+            pigs_pool = self._groups_model.get_group(group)
+
+            # The error bars of a group are drawn as a single collection of vertical segments
+            color = 'C{}'.format(group_id % 10)
+            errorbars = LineCollection([], colors=color)
+            self._axes.add_collection(errorbars)
+            plot = self._axes.plot([], [], 'o', color=color, label=group)[0]
+            self._group_plots.append((errorbars, plot))
+
+            if len(pigs_pool) == 0:
+                continue
+
+            try:
+                reduced_averages = pigs_pool.reduced_statistics(self._selected_property, selected_statistics='mean', output_statistics=['mean', 'std'])
+            except PigsPoolError as error:
+                logging.error(str(error))
+                continue
+
+            averages = reduced_averages['mean']
+            stds = reduced_averages['std']
+
+            x = np.arange(len(averages))
+            n_intervals = max(n_intervals, len(x))
+
+            segments = np.stack([np.column_stack([x, averages-stds]), np.column_stack([x, averages+stds])], axis=1)
+            errorbars.set_segments(segments)
+            plot.set_data(x, averages)
+
+            errorbars_ends.append(segments.reshape(-1, 2))
+
+        # The limits of the axes cover all the groups such as they do not change from one group selection to another
+        self._axes.relim()
+        if errorbars_ends:
+            self._axes.update_datalim(np.concatenate(errorbars_ends))
+        self._axes.autoscale_view()
+
+        # The ticks are set once for all the groups
+        main_window = find_main_window()
+        interval_data = main_window.intervals_widget.interval_settings_label.data()
+        self._tick_labels = range(1, n_intervals+1) if interval_data is None else build_timeline(-10, int(interval_data[2]), range(n_intervals))
+
+        self._axes.legend(handles=[plot for _, plot in self._group_plots])
+
     def build_widgets(self):
         """Build and/or initialize the widgets of the dialog.
         """
@@ -58,12 +119,18 @@ class GroupAveragesDialog(QtWidgets.QDialog):
         self._canvas = FigureCanvasQTAgg(self._figure)
         self._toolbar = NavigationToolbarWithExportButton(self._canvas, self)
 
+        self._tick_labels = []
+        self._axes = self._figure.add_subplot(111)
+        self._axes.set_xlabel('interval')
+        self._axes.set_ylabel(self._selected_property)
+        self._axes.xaxis.set_major_locator(ticker.IndexLocator(base=10.0, offset=0.0))
+        self._axes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda tick_val, tick_pos: func_formatter(tick_val, tick_pos, self._tick_labels)))
+
+        # The background of the axes (without the averages and standard deviations) used for blitting
+        self._background = None
+
         self._selected_group_combo = QtWidgets.QComboBox()
-        group_names = ['all']
-        for i in range(self._groups_model.rowCount()):
-            index = self._groups_model.index(i)
-            group_names.append(self._groups_model.data(index, QtCore.Qt.DisplayRole))
-        self._selected_group_combo.addItems(group_names)
+        self._selected_group_combo.addItems(['all'] + self._groups_model.group_names)
 
     def init_ui(self):
         """Initialiwes the dialog.
@@ -71,61 +138,57 @@ class GroupAveragesDialog(QtWidgets.QDialog):
 
         self.build_widgets()
 
+        self.build_plots()
+
         self.build_layout()
 
         self.build_events()
 
         self.on_select_group(0)
 
+    def on_draw(self, event):
+        """Event fired when the figure is fully redrawn (resize, zoom ...).
+
+        The blitting background is not valid anymore and will be rebuilt at the next group selection.
+
+        Args:
+            event (matplotlib.backend_bases.DrawEvent): the draw event
+        """
+
+        self._background = None
+
     def on_select_group(self, row):
-        """Plot the averages and standard deviations over record intervals for a selected group.
+        """Show the averages and standard deviations over record intervals for a selected group.
 
         Args:
             row (int): the selected group
         """
 
-        selected_group_model = self._selected_group_combo.model()
-        if selected_group_model.rowCount() == 0:
+        if row < 0:
             return
 
-        group = selected_group_model.item(row, 0).data(QtCore.Qt.DisplayRole)
-        if group == 'all':
-            selected_groups = range(self._groups_model.rowCount())
+        # The first entry of the combo box stands for all the groups, the next ones follow the order of the group plots
+        if row == 0:
+            selected_groups = range(len(self._group_plots))
         else:
             selected_groups = [row-1]
 
-        # If there is already a plot, remove it
-        if hasattr(self, '_axes'):
-            self._axes.remove()
-
-        # Plot the averages and standard deviations
-        self._axes = self._figure.add_subplot(111)
-        self._axes.set_xlabel('interval')
-        self._axes.set_ylabel(self._selected_property)
-
-        for group_id in selected_groups:
-
-            pigs_pool = self._groups_model.data(self._groups_model.index(group_id, 0), self._groups_model.PigsPool)
-            if len(pigs_pool) == 0:
-                continue
-
-            try:
-                reduced_averages = pigs_pool.reduced_statistics(self._selected_property, selected_statistics='mean', output_statistics=['mean', 'std'])
-            except PigsPoolError as error:
-                logging.error(str(error))
-                return
-
-            x = range(0, len(reduced_averages['mean']))
-            main_window = find_main_window()
-            interval_data = main_window.intervals_widget.interval_settings_label.data()
-            tick_labels = range(1, len(x)+1) if interval_data is None else build_timeline(-10, int(interval_data[2]), x)
-
-            self._axes.errorbar(x, reduced_averages['mean'], yerr=reduced_averages['std'], fmt='o')
-            self._axes.xaxis.set_major_locator(ticker.IndexLocator(base=10.0, offset=0.0))
-            self._axes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda tick_val, tick_pos: func_formatter(tick_val, tick_pos, tick_labels)))
-
-        group_names = self._groups_model.pigs_groups.groups.keys()
+        # The background is drawn without any group and saved once. The selected groups are then drawn on top of it.
+        if self._background is None:
+            for errorbars, plot in self._group_plots:
+                errorbars.set_visible(False)
+                plot.set_visible(False)
+            self._canvas.draw()
+            self._background = self._canvas.copy_from_bbox(self._axes.bbox)
+        else:
+            self._canvas.restore_region(self._background)
 
-        self._axes.legend(group_names)
+        for group_id, (errorbars, plot) in enumerate(self._group_plots):
+            visible = group_id in selected_groups
+            errorbars.set_visible(visible)
+            plot.set_visible(visible)
+            if visible:
+                self._axes.draw_artist(errorbars)
+                self._axes.draw_artist(plot)
 
-        self._canvas.draw()
+        self._canvas.blit(self._axes.bbox)
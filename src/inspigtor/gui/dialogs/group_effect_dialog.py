@@ -1,14 +1,13 @@
 import logging
 
+import numpy as np
+
 import pandas as pd
 
 from PyQt5 import QtWidgets
 
 import matplotlib.ticker as ticker
-from pylab import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-
-from pylab import Figure
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 
 from inspigtor.gui.models.pvalues_data_model import PValuesDataModel
@@ -74,6 +73,44 @@ class GroupEffectDialog(QtWidgets.QDialog):
 
         self.setLayout(main_layout)
 
+    def build_p_value_plot(self):
+        """Build the dialog which plots the Dunn p values of a pair of groups against time.
+
+        The dialog is built the first time a pair of groups is plotted and reused for the next ones.
+        """
+
+        self._p_value_plot_dialog = QtWidgets.QDialog(self)
+
+        self._p_value_plot_dialog.setGeometry(0, 0, 300, 300)
+
+        self._p_value_figure = Figure()
+        self._p_value_axes = self._p_value_figure.add_subplot(111)
+        self._p_value_canvas = FigureCanvasQTAgg(self._p_value_figure)
+        toolbar = NavigationToolbarWithExportButton(self._p_value_canvas, self._p_value_plot_dialog)
+
+        initial_interval_index = list(self._pairwise_effect.keys()).index('0h00')
+
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(self._p_value_canvas)
+        layout.addWidget(toolbar)
+        self._p_value_plot_dialog.setLayout(layout)
+
+        # The p values are bounded such as the limits of the axes do not depend on the plotted pair of groups
+        times = list(self._pairwise_effect.keys())
+        self._p_value_axes.set_xlabel('time')
+        self._p_value_axes.set_ylabel('p_value')
+        self._p_value_axes.set_ylim(-0.05, 1.05)
+        self._p_value_plot = self._p_value_axes.plot(np.arange(len(times)), np.zeros(len(times)), 'o')[0]
+
+        # The times are plotted by index. The locator, the formatter and the style of the tick labels are set once for all the plots.
+        self._p_value_axes.xaxis.set_major_locator(ticker.IndexLocator(base=10.0, offset=initial_interval_index))
+        self._p_value_axes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda tick_val, tick_pos: func_formatter(tick_val, tick_pos, times)))
+        self._p_value_axes.tick_params(axis='x', labelsize=8, labelrotation=90)
+
+        # The background of the axes (without the p values) used for blitting
+        self._p_value_background = None
+        self._p_value_canvas.mpl_connect('draw_event', self.on_draw_p_value_plot)
+
     def build_widgets(self):
         """Build and/or initialize the widgets of the dialog.
         """
@@ -107,6 +144,9 @@ class GroupEffectDialog(QtWidgets.QDialog):
 
         self._export_all_button = QtWidgets.QPushButton('Export all')
 
+        # The p values plot is built the first time a pair of groups is plotted
+        self._p_value_plot_dialog = None
+
     def init_ui(self):
         """Initialiwes the dialog.
         """
@@ -126,40 +166,41 @@ class GroupEffectDialog(QtWidgets.QDialog):
         group1 = self._selected_group_1.currentText()
         group2 = self._selected_group_2.currentText()
 
-        x = list(self._pairwise_effect.keys())
         y = []
         for data_frame in self._pairwise_effect.values():
             y.append(data_frame.loc[group1, group2])
 
-        plot_widget = QtWidgets.QDialog(self)
+        if self._p_value_plot_dialog is None:
+            self.build_p_value_plot()
 
-        plot_widget.setGeometry(0, 0, 300, 300)
+        self._p_value_plot_dialog.setWindowTitle('p-values vs time for {} vs {} for {} property'.format(group1, group2, self._selected_property))
 
-        plot_widget.setWindowTitle('p-values vs time for {} vs {} for {} property'.format(group1, group2, self._selected_property))
+        self._p_value_plot.set_ydata(y)
 
-        figure = Figure()
-        axes = figure.add_subplot(111)
-        canvas = FigureCanvasQTAgg(figure)
-        toolbar = NavigationToolbarWithExportButton(canvas, plot_widget)
+        # The background is drawn without the p values and saved once. The p values are then drawn on top of it.
+        if self._p_value_background is None:
+            self._p_value_plot.set_visible(False)
+            self._p_value_canvas.draw()
+            self._p_value_background = self._p_value_canvas.copy_from_bbox(self._p_value_axes.bbox)
+            self._p_value_plot.set_visible(True)
+        else:
+            self._p_value_canvas.restore_region(self._p_value_background)
 
-        initial_interval_index = list(self._pairwise_effect.keys()).index('0h00')
+        self._p_value_axes.draw_artist(self._p_value_plot)
+        self._p_value_canvas.blit(self._p_value_axes.bbox)
 
-        layout = QtWidgets.QVBoxLayout()
-        layout.addWidget(canvas)
-        layout.addWidget(toolbar)
-        plot_widget.setLayout(layout)
-
-        axes.set_xlabel('time')
-        axes.set_ylabel('p_value')
-        axes.plot(x, y, 'o')
-        loc = ticker.IndexLocator(base=10.0, offset=initial_interval_index)
-        axes.xaxis.set_major_locator(loc)
-        for tick in axes.xaxis.get_major_ticks():
-            tick.label.set_fontsize(8)
-            tick.label.set_rotation('vertical')
-        canvas.draw()
-
-        plot_widget.show()
+        self._p_value_plot_dialog.show()
+
+    def on_draw_p_value_plot(self, event):
+        """Event fired when the p values plot is fully redrawn (resize, zoom ...).
+
+        The blitting background is not valid anymore and will be rebuilt at the next plot.
+
+        Args:
+            event (matplotlib.backend_bases.DrawEvent): the draw event
+        """
+
+        self._p_value_background = None
 
     def on_export_all(self):
         """Export global and local effects in a excel file
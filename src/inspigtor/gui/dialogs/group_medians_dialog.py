@@ -2,10 +2,10 @@ import logging
 
 import numpy as np
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtWidgets
 
 import matplotlib.ticker as ticker
-from pylab import Figure
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
 
 from inspigtor.gui.utils.helper_functions import find_main_window, func_formatter
@@ -24,6 +24,9 @@ class GroupMediansDialog(QtWidgets.QDialog):
 
         self._selected_property = selected_property
 
+        # The main window is resolved once, its interval settings being read at each group selection
+        self._main_window = find_main_window()
+
         self.init_ui()
 
     def build_events(self):
@@ -58,9 +61,17 @@ class GroupMediansDialog(QtWidgets.QDialog):
         self._canvas = FigureCanvasQTAgg(self._figure)
         self._toolbar = NavigationToolbar2QT(self._canvas, self)
 
+        # The axes, its labels, its tick locator and its tick formatter are built once and reused from one group to another
+        self._axes = self._figure.add_subplot(111)
+        self._axes.set_xlabel('interval')
+        self._axes.set_ylabel(self._selected_property)
+        self._plot = None
+        self._tick_labels = []
+        self._tick_locator = ticker.IndexLocator(base=10.0, offset=0.0)
+        self._tick_formatter = ticker.FuncFormatter(lambda tick_val, tick_pos: func_formatter(tick_val, tick_pos, self._tick_labels))
+
         self._selected_group_combo = QtWidgets.QComboBox()
-        group_names = [self._groups_model.data(self._groups_model.index(row), QtCore.Qt.DisplayRole) for row in range(self._groups_model.rowCount())]
-        self._selected_group_combo.addItems(group_names)
+        self._selected_group_combo.addItems(self._groups_model.group_names)
 
     def init_ui(self):
         """Initialiwes the dialog.
@@ -81,39 +92,36 @@ class GroupMediansDialog(QtWidgets.QDialog):
             row (int): the selected group
         """
 
-        selected_group_model = self._selected_group_combo.model()
-        if selected_group_model.rowCount() == 0:
+        if row < 0:
             return
 
-        group = selected_group_model.item(row, 0).data(QtCore.Qt.DisplayRole)
-        pigs_groups = self._groups_model.pigs_groups
-        if group not in pigs_groups:
+        # The group is fetched by name from the groups dictionary, its absence meaning that it is not defined anymore
+        group = self._selected_group_combo.itemText(row)
+        pigs_pool = self._groups_model.get_group(group)
+        if pigs_pool is None:
             logging.warning('Can not find group with name {}'.format(group))
             return
 
-        pigs_pool = self._groups_model.data(self._groups_model.index(row, 0), self._groups_model.PigsPool)
         if len(pigs_pool) == 0:
             return
 
         _, individual_averages = pigs_pool.get_statistics(self._selected_property)
         individual_averages = [[v for v in row if not np.isnan(v)] for row in individual_averages]
 
-        # If there is already a plot, remove it
-        if hasattr(self, '_axes'):
-            self._axes.remove()
-
-        # Plot the averages and standard deviations
-        self._axes = self._figure.add_subplot(111)
-        self._axes.set_xlabel('interval')
-        self._axes.set_ylabel(self._selected_property)
+        # Only the artists of the previous boxplot are removed. The data limits are reset such as they only cover the new boxplot.
+        if self._plot is not None:
+            for artists in self._plot.values():
+                for artist in artists:
+                    artist.remove()
+        self._axes.relim()
 
         x = range(len(individual_averages))
-        main_window = find_main_window()
-        interval_data = main_window.intervals_widget.interval_settings_label.data()
-        tick_labels = range(1, len(x)+1) if interval_data is None else build_timeline(-10, int(interval_data[2]), x)
+        interval_data = self._main_window.intervals_widget.interval_settings_label.data()
+        self._tick_labels = range(1, len(x)+1) if interval_data is None else build_timeline(-10, int(interval_data[2]), x)
 
+        # The boxplot sets its own ticks, hence the locator and the formatter of the axes are set back afterwards
         self._plot = self._axes.boxplot(individual_averages, showfliers=False)
-        self._axes.xaxis.set_major_locator(ticker.IndexLocator(base=10.0, offset=0.0))
-        self._axes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda tick_val, tick_pos: func_formatter(tick_val, tick_pos, tick_labels)))
+        self._axes.xaxis.set_major_locator(self._tick_locator)
+        self._axes.xaxis.set_major_formatter(self._tick_formatter)
 
-        self._canvas.draw()
+        self._canvas.draw_idle()
@@ -2,16 +2,16 @@ import logging
 
 import numpy as np
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtWidgets
 
 import matplotlib.ticker as ticker
-from pylab import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 
-from inspigtor.gui.utils.helper_functions import find_main_window, func_formatter
+from inspigtor.gui.utils.helper_functions import func_formatter
 from inspigtor.gui.utils.navigation_toolbar import NavigationToolbarWithExportButton
 from inspigtor.kernel.readers.picco2_reader import PiCCO2FileReaderError
-from inspigtor.kernel.utils.helper_functions import build_timeline
 
 
 class IndividualAveragesDialog(QtWidgets.QDialog):
@@ -33,6 +33,7 @@ class IndividualAveragesDialog(QtWidgets.QDialog):
         """
 
         self._selected_pig_combo.currentIndexChanged.connect(self.on_select_pig)
+        self._canvas.mpl_connect('draw_event', self.on_draw)
 
     def build_layout(self):
         """Build the layout.
@@ -60,13 +61,24 @@ class IndividualAveragesDialog(QtWidgets.QDialog):
         self._canvas = FigureCanvasQTAgg(self._figure)
         self._toolbar = NavigationToolbarWithExportButton(self._canvas, self)
 
-        pig_names = []
-        for row in range(self._pigs_model.rowCount()):
-            index = self._pigs_model.index(row)
-            pig_names.append(self._pigs_model.data(index, QtCore.Qt.DisplayRole))
+        # The axes and its artists are built once and only their data are updated when a new pig is selected
+        self._timeline = []
+        self._axes = self._figure.add_subplot(111)
+        self._axes.set_xlabel('interval')
+        self._axes.set_ylabel(self._selected_property)
+        self._errorbars = LineCollection([], colors='r')
+        self._axes.add_collection(self._errorbars)
+        self._plot = self._axes.plot([], [], 'ro')[0]
+        self._axes.xaxis.set_major_locator(ticker.IndexLocator(base=10.0, offset=0.0))
+        self._axes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda tick_val, tick_pos: func_formatter(tick_val, tick_pos, self._timeline)))
+        self._axes.tick_params(axis='x', labelsize=8, labelrotation=90)
+
+        # The background of the axes (without the averages and standard deviations) used for blitting
+        self._background = None
+        self._layout = None
 
         self._selected_pig_combo = QtWidgets.QComboBox()
-        self._selected_pig_combo.addItems(pig_names)
+        self._selected_pig_combo.addItems(self._pigs_model.pig_names)
 
     def init_ui(self):
         """Initialiwes the dialog.
@@ -80,6 +92,17 @@ class IndividualAveragesDialog(QtWidgets.QDialog):
 
         self.on_select_pig(0)
 
+    def on_draw(self, event):
+        """Event fired when the figure is fully redrawn (resize, zoom ...).
+
+        The blitting background is not valid anymore and will be rebuilt at the next pig selection.
+
+        Args:
+            event (matplotlib.backend_bases.DrawEvent): the draw event
+        """
+
+        self._background = None
+
     def on_select_pig(self, row):
         """Plot the averages and standard deviations over record intervals for a selected pig.
 
@@ -96,28 +119,36 @@ class IndividualAveragesDialog(QtWidgets.QDialog):
             logging.error(str(error))
             return
 
-        averages = []
-        stds = []
-        for interval, average, std in zip(individual_averages['intervals'], individual_averages['mean'], individual_averages['std']):
-            averages.append(average)
-            stds.append(std)
-
-        # If there is already a plot, remove it
-        if hasattr(self, '_axes'):
-            self._axes.remove()
-
-        # Plot the averages and standard deviations
-        self._axes = self._figure.add_subplot(111)
-        self._axes.set_xlabel('interval')
-        self._axes.set_ylabel(self._selected_property)
-
-        timeline = reader.timeline
-
-        self._plot = self._axes.errorbar(timeline, averages, yerr=stds, fmt='ro')
-        loc = ticker.IndexLocator(base=10.0, offset=reader.t_initial_interval_index)
-        self._axes.xaxis.set_major_locator(loc)
-        for tick in self._axes.xaxis.get_major_ticks():
-            tick.label.set_fontsize(8)
-            tick.label.set_rotation('vertical')
-
-        self._canvas.draw()
+        averages = individual_averages['mean']
+        stds = individual_averages['std']
+
+        self._timeline = reader.timeline
+        x = np.arange(len(self._timeline))
+
+        # Update the averages and standard deviations. The error bars are drawn as a single collection of vertical segments.
+        segments = np.stack([np.column_stack([x, averages-stds]), np.column_stack([x, averages+stds])], axis=1)
+        self._errorbars.set_segments(segments)
+        self._plot.set_data(x, averages)
+        self._axes.xaxis.get_major_locator().set_params(offset=reader.t_initial_interval_index)
+
+        self._axes.relim()
+        self._axes.update_datalim(segments.reshape(-1, 2))
+        self._axes.autoscale_view()
+
+        # If the limits and the ticks of the axes did not change, only the averages and standard deviations are redrawn on top of
+        # the saved background. Otherwise, the background is redrawn without them and saved for the next pig selections.
+        layout = (tuple(self._axes.viewLim.bounds), tuple(self._timeline), reader.t_initial_interval_index)
+        if self._background is None or layout != self._layout:
+            self._errorbars.set_visible(False)
+            self._plot.set_visible(False)
+            self._canvas.draw()
+            self._background = self._canvas.copy_from_bbox(self._axes.bbox)
+            self._layout = layout
+            self._errorbars.set_visible(True)
+            self._plot.set_visible(True)
+        else:
+            self._canvas.restore_region(self._background)
+
+        self._axes.draw_artist(self._errorbars)
+        self._axes.draw_artist(self._plot)
+        self._canvas.blit(self._axes.bbox)
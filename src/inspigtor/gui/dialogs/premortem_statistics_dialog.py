@@ -8,13 +8,9 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 
 import pandas as pd
 
-from pylab import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
-
 from inspigtor.gui.dialogs.dunn_matrix_dialog import DunnMatrixDialog
 from inspigtor.gui.models.pvalues_data_model import PValuesDataModel
 from inspigtor.gui.views.copy_pastable_tableview import CopyPastableTableView
-from inspigtor.kernel.utils.helper_functions import build_timeline
 
 
 class PreMortemStatisticsDialog(QtWidgets.QDialog):
@@ -1,9 +1,9 @@
-import numpy as np
-
 from PyQt5 import QtWidgets
 
-from pylab import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+
+from inspigtor.gui.utils.navigation_toolbar import NavigationToolbarWithExportButton
 
 
 class PropertyPlotterDialog(QtWidgets.QDialog):
@@ -32,7 +32,7 @@ class PropertyPlotterDialog(QtWidgets.QDialog):
         # Build the matplotlib imshow widget
         self._figure = Figure()
         self._canvas = FigureCanvasQTAgg(self._figure)
-        self._toolbar = NavigationToolbar2QT(self._canvas, self)
+        self._toolbar = NavigationToolbarWithExportButton(self._canvas, self)
 
     def init_ui(self):
         """
@@ -52,4 +52,5 @@ class PropertyPlotterDialog(QtWidgets.QDialog):
 
         self._plot = self._axes.plot(xs, ys, 'ro')
 
-        self._canvas.draw()
+        # The figure is rendered once when the dialog is painted for the first time
+        self._canvas.draw_idle()
@@ -1,14 +1,9 @@
 import logging
-import os
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-from pylab import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg, NavigationToolbar2QT
-
 from inspigtor.gui.dialogs.dunn_matrix_dialog import DunnMatrixDialog
 from inspigtor.gui.models.pvalues_data_model import PValuesDataModel
-from inspigtor.gui.utils.helper_functions import find_main_window
 from inspigtor.gui.views.copy_pastable_tableview import CopyPastableTableView
 
 
@@ -34,6 +29,7 @@ class TimeEffectDialog(QtWidgets.QDialog):
         """Build signal/slots
         """
 
+        self._selected_group_combo.currentIndexChanged.connect(self.on_select_group)
         self._dunn_table.customContextMenuRequested.connect(self.on_show_dunn_table_menu)
 
     def build_layout(self):
@@ -92,13 +88,10 @@ class TimeEffectDialog(QtWidgets.QDialog):
         for col in range(model.columnCount()):
             self._friedman_table.horizontalHeader().setSectionResizeMode(col, QtWidgets.QHeaderView.ResizeToContents)
 
+        # The combo only stores the names of the groups, their Dunn matrices being looked up by name in the pairwise effect. Adding the
+        # first group selects it, which displays its matrix through on_select_group.
         self._selected_group_combo.clear()
         self._selected_group_combo.addItems(self._pairwise_effect.keys())
-        for i, p_values in enumerate(self._pairwise_effect.values()):
-            self._selected_group_combo.setItemData(i, p_values)
-
-        self._selected_group_combo.currentIndexChanged.connect(self.on_select_group)
-        self.on_select_group(0)
 
     def init_ui(self):
         """Initializes the ui.
@@ -136,7 +129,10 @@ class TimeEffectDialog(QtWidgets.QDialog):
             selected_group (int): the selected group
         """
 
-        p_values = self._selected_group_combo.itemData(selected_group)
+        if selected_group < 0:
+            return
+
+        p_values = self._pairwise_effect[self._selected_group_combo.itemText(selected_group)]
 
         model = PValuesDataModel(p_values)
 
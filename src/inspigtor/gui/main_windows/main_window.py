@@ -1,15 +1,19 @@
 import collections
-import glob
 import logging
 import os
 import sys
 
+import matplotlib
+matplotlib.use('Qt5Agg')
+
+import numpy as np
+
+import pandas as pd
+
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 import inspigtor
 from inspigtor.__pkginfo__ import __version__
-from inspigtor.gui.dialogs.individual_averages_dialog import IndividualAveragesDialog
-from inspigtor.gui.dialogs.property_plotter_dialog import PropertyPlotterDialog
 from inspigtor.gui.models.pigs_pool_model import PigsPoolModel
 from inspigtor.gui.models.pandas_data_model import PandasDataModel
 from inspigtor.gui.views.copy_pastable_tableview import CopyPastableTableView
@@ -18,7 +22,9 @@ from inspigtor.gui.widgets.intervals_widget import IntervalsWidget
 from inspigtor.gui.widgets.logger_widget import QTextEditLogger
 from inspigtor.gui.widgets.multiple_directories_selector import MultipleDirectoriesSelector
 from inspigtor.gui.widgets.statistics_widget import StatisticsWidget
-from inspigtor.kernel.readers.picco2_reader import PiCCO2FileReader, PiCCO2FileReaderError
+from inspigtor.gui.workers.function_worker import FunctionWorker
+from inspigtor.kernel.readers.picco2_reader import PiCCO2FileReader, PiCCO2FileReaderError, read_picco2_files
+from inspigtor.kernel.utils.helper_functions import find_csv_files
 from inspigtor.kernel.utils.progress_bar import progress_bar
 
 
@@ -59,12 +65,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self._data_table.customContextMenuRequested.connect(self.on_show_data_table_menu)
         self._pigs_list.double_clicked_empty.connect(self.on_load_experiment_data)
         self._pigs_list.customContextMenuRequested.connect(self.on_show_pigs_list_menu)
+        self._pigs_list.selectionModel().currentChanged.connect(self.on_select_pig)
         self._intervals_widget.record_interval_selected.connect(self.on_record_interval_selected)
         self._intervals_widget.update_properties.connect(self.on_update_properties)
         self.pig_selected.connect(self._intervals_widget.on_update_record_intervals)
         self._selected_property_combo.currentTextChanged.connect(self.on_change_selected_property)
         self._show_individual_averages_button.clicked.connect(self.on_show_individual_averages)
         self._pigs_list.model().reader_removed.connect(self._statistics_widget.on_remove_reader)
+        self._intervals_widget.record_intervals_updated.connect(self._statistics_widget.on_update_record_intervals)
 
     def build_layout(self):
         """Build the layout.
@@ -201,6 +209,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._show_individual_averages_button = QtWidgets.QPushButton('Show individual averages')
 
         self._data_table = CopyPastableTableView()
+        self._data_table.setModel(PandasDataModel(pd.DataFrame()))
         self._data_table.setSelectionBehavior(QtWidgets.QTableView.SelectRows)
         self._data_table.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
 
@@ -241,6 +250,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._reader = None
 
+        self._read_picco2_files_worker = None
+
         self.build_widgets()
 
         self.build_layout()
@@ -325,39 +336,28 @@ class MainWindow(QtWidgets.QMainWindow):
 
         pigs_model = self._pigs_list.model()
 
-        progress_bar.reset(len(experimental_dirs))
+        data_files = []
+        data_file_groups = {}
+        for exp_dir in experimental_dirs:
+            group = os.path.basename(exp_dir)
+            for data_file in find_csv_files(exp_dir):
+                data_files.append(data_file)
+                data_file_groups[data_file] = group
 
-        n_loaded_dirs = 0
+        def on_read(readers):
+            pigs_model.add_readers(readers)
 
-        groups = collections.OrderedDict()
+            groups = collections.OrderedDict()
+            for reader in readers:
+                groups.setdefault(data_file_groups[reader.filename], []).append(reader.filename)
 
-        # Loop over the pig directories
-        for progress, exp_dir in enumerate(experimental_dirs):
-
-            data_files = glob.glob(os.path.join(exp_dir, '*.csv'))
-
-            # Loop over the Data*csv csv files found in the current oig directory
-            for data_file in data_files:
-                try:
-                    reader = PiCCO2FileReader(data_file)
-                except PiCCO2FileReaderError as error:
-                    logging.error(str(error))
-                    continue
-                else:
-                    pigs_model.add_reader(reader)
-                    groups.setdefault(os.path.basename(exp_dir), []).append(data_file)
-
-            n_loaded_dirs += 1
-            progress_bar.update(progress+1)
-
-        # Create a signal/slot connexion for row changed event
-        self._pigs_list.selectionModel().currentChanged.connect(self.on_select_pig)
+            self._pigs_list.setCurrentIndex(pigs_model.index(0, 0))
 
-        self._pigs_list.setCurrentIndex(pigs_model.index(0, 0))
+            self.import_groups_from_directories.emit(groups)
 
-        self.import_groups_from_directories.emit(groups)
+            logging.info('Imported successfully {} groups out of {} directories'.format(len(groups), len(experimental_dirs)))
 
-        logging.info('Imported successfully {} groups out of {} directories'.format(n_loaded_dirs, len(experimental_dirs)))
+        self.read_picco2_files(data_files, on_read)
 
     def on_load_experiment_data(self):
         """Event fired when the user loads expriment data by clicking on File -> Open or double clicking on the data list view when it is empty.
@@ -371,33 +371,16 @@ class MainWindow(QtWidgets.QMainWindow):
         pigs_model = self._pigs_list.model()
 
         n_csv_files = len(csv_files)
-        progress_bar.reset(n_csv_files)
 
-        n_loaded_files = 0
+        def on_read(readers):
+            pigs_model.add_readers(readers)
 
-        # Loop over the pig directories
-        for progress, csv_file in enumerate(csv_files):
+            self._pigs_list.setCurrentIndex(pigs_model.index(0, 0))
 
-            if pigs_model.get_pig(csv_file) is not None:
-                continue
+            logging.info('Loaded successfully {} files out of {}'.format(len(readers), n_csv_files))
 
-            try:
-                reader = PiCCO2FileReader(csv_file)
-            except PiCCO2FileReaderError as error:
-                logging.error(str(error))
-                continue
-            else:
-                pigs_model.add_reader(reader)
-                n_loaded_files += 1
-            finally:
-                progress_bar.update(progress+1)
-
-        # Create a signal/slot connexion for row changed event
-        self._pigs_list.selectionModel().currentChanged.connect(self.on_select_pig)
-
-        self._pigs_list.setCurrentIndex(pigs_model.index(0, 0))
-
-        logging.info('Loaded successfully {} files out of {}'.format(n_loaded_files, n_csv_files))
+        # Only the csv files which are not loaded yet are read
+        self.read_picco2_files([csv_file for csv_file in csv_files if pigs_model.get_pig(csv_file) is None], on_read)
 
     def on_load_experimental_dirs(self):
         """Opens several experimental directories.
@@ -414,39 +397,36 @@ class MainWindow(QtWidgets.QMainWindow):
 
         pigs_model = self._pigs_list.model()
 
-        progress_bar.reset(len(experimental_dirs))
-
-        n_loaded_dirs = 0
+        data_files = []
+        for exp_dir in experimental_dirs:
+            data_files.extend(find_csv_files(exp_dir))
 
-        # Loop over the pig directories
-        for progress, exp_dir in enumerate(experimental_dirs):
+        def on_read(readers):
+            # Insert all the readers at once to trigger a single update of the pigs list view
+            pigs_model.add_readers(readers)
 
-            data_files = glob.glob(os.path.join(exp_dir, '*.csv'))
+            self._pigs_list.setCurrentIndex(pigs_model.index(0, 0))
 
-            # Loop over the csv files found in the current oig directory
-            for data_file in data_files:
-                try:
-                    reader = PiCCO2FileReader(data_file)
-                except PiCCO2FileReaderError as error:
-                    logging.error(str(error))
-                    continue
-                else:
-                    pigs_model.add_reader(reader)
+            logging.info('Loaded successfully {} files out of {} from {} directories'.format(len(readers), len(data_files), len(experimental_dirs)))
 
-            n_loaded_dirs += 1
-            progress_bar.update(progress+1)
+        self.read_picco2_files(data_files, on_read)
 
-        # Create a signal/slot connexion for row changed event
-        self._pigs_list.selectionModel().currentChanged.connect(self.on_select_pig)
+    def on_plot_action(self, action):
+        """Event fired when the user selects a property in the 'Plot' menu of the data table contextual menu.
 
-        self._pigs_list.setCurrentIndex(pigs_model.index(0, 0))
+        Args:
+            action (PyQt5.QtWidgets.QAction): the triggered action
+        """
 
-        logging.info('Loaded successfully {} directories out of {}'.format(n_loaded_dirs, len(experimental_dirs)))
+        self.on_plot_property(action.isChecked(), action.data())
 
     def on_plot_property(self, checked, selected_property):
         """Plot one property of the PiCCO file.
 
+        Only the values which can be casted to a float are plotted, against their row index in the data table.
+
         Args:
+            checked (bool): the check state of the triggering action
             selected_property (str): the property to plot
         """
 
@@ -457,21 +437,18 @@ class MainWindow(QtWidgets.QMainWindow):
         index = pigs_model.index(selected_row, 0)
         reader = pigs_model.data(index, pigs_model.Reader)
 
-        # Build the x and y values
-        xs = []
-        ys = []
-        for i, v in enumerate(reader.data[selected_property][:]):
-            try:
-                value = float(v)
-            except ValueError:
-                pass
-            else:
-                xs.append(i)
-                ys.append(value)
-
-        if not ys:
+        # Build the x and y values keeping only the float-evaluable values
+        values = reader.get_numeric_column(selected_property)
+        mask = ~np.isnan(values)
+        if not mask.any():
             return
 
+        xs = np.flatnonzero(mask)
+        ys = values[mask]
+
+        # The dialog module is only imported when a property is plotted for the first time
+        from inspigtor.gui.dialogs.property_plotter_dialog import PropertyPlotterDialog
+
         # Pops up a plot of the selected property
         dialog = PropertyPlotterDialog(self)
         dialog.plot_property(selected_property, xs, ys)
@@ -496,7 +473,7 @@ class MainWindow(QtWidgets.QMainWindow):
         model = self._data_table.model()
 
         # Color in grey the selected record interval
-        model.setColoredRows(dict([(r, QtGui.QColor('gray')) for r in range(row_min, row_max)]))
+        model.setColoredRows(row_min, row_max, QtGui.QColor('gray'))
 
         # Displace the cursor of the data table to the first index of the selected record interval
         index = model.index(row_min, 0)
@@ -512,12 +489,12 @@ class MainWindow(QtWidgets.QMainWindow):
         reader = self._pigs_list.model().data(index, PigsPoolModel.Reader)
 
         if reader == QtCore.QVariant():
-            self._data_table.setModel(None)
+            self._data_table.model().setDataFrame(pd.DataFrame())
             return
 
         # Update the data table with the selected data
         data = reader.data
-        self._data_table.setModel(PandasDataModel(data))
+        self._data_table.model().setDataFrame(data)
 
         record_intervals = reader.record_intervals
         if record_intervals is None:
@@ -533,7 +510,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         data_model = self._data_table.model()
 
-        if data_model is None:
+        if data_model.rowCount() == 0:
             return
 
         menu = QtWidgets.QMenu()
@@ -546,10 +523,11 @@ class MainWindow(QtWidgets.QMainWindow):
         index = pigs_model.index(self._pigs_list.currentIndex().row(), 0)
         reader = pigs_model.data(index, pigs_model.Reader)
 
-        properties = reader.data.columns
-        for prop in properties:
+        # The property is stored in each action so that all the actions can be routed to a single slot
+        for prop in reader.properties:
             action = plot_menu.addAction(prop)
-            action.triggered.connect(lambda checked, prop=prop: self.on_plot_property(checked, prop))
+            action.setData(prop)
+        plot_menu.triggered.connect(self.on_plot_action)
 
         menu.addMenu(plot_menu)
         menu.exec_(QtGui.QCursor.pos())
@@ -563,6 +541,9 @@ class MainWindow(QtWidgets.QMainWindow):
         if n_pigs == 0:
             return
 
+        # The dialog module is only imported when the individual averages are displayed for the first time
+        from inspigtor.gui.dialogs.individual_averages_dialog import IndividualAveragesDialog
+
         dialog = IndividualAveragesDialog(pigs_model, self)
         dialog.show()
 
@@ -584,8 +565,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         reader = pigs_model.data(pigs_model.index(current_row), pigs_model.Reader)
 
-        properties = reader.data.columns
-        for prop in properties:
+        for prop in reader.properties:
             action = write_summary_menu.addAction(prop)
             action.triggered.connect(lambda checked, prop=prop: self.on_write_summary(checked, prop))
 
@@ -602,12 +582,25 @@ class MainWindow(QtWidgets.QMainWindow):
             properties (list of str): the properties
         """
 
-        # Reset the property combobox
+        # The combobox is left untouched if the properties did not change (e.g. when switching between pigs coming from the same device)
+        current_properties = [self._selected_property_combo.itemText(i) for i in range(self._selected_property_combo.count())]
+        if current_properties == list(properties):
+            return
+
+        previous_property = self._selected_property_combo.currentText()
+
+        # Reset the property combobox. Its signals are blocked meanwhile such as the selected property is updated only once.
+        self._selected_property_combo.blockSignals(True)
         self._selected_property_combo.clear()
         self._selected_property_combo.addItems(properties)
         index = self._selected_property_combo.findText('APs', QtCore.Qt.MatchFixedString)
         if index >= 0:
             self._selected_property_combo.setCurrentIndex(index)
+        self._selected_property_combo.blockSignals(False)
+
+        selected_property = self._selected_property_combo.currentText()
+        if selected_property != previous_property:
+            self.on_change_selected_property(selected_property)
 
     def on_write_summary(self, checked, selected_property):
         """Event fired when the user click on the 'Write summary' menu button of pigs list contextual menu.
@@ -634,6 +627,42 @@ class MainWindow(QtWidgets.QMainWindow):
         except PiCCO2FileReaderError as e:
             logging.error(str(e))
 
+    @property
+    def pigs_list(self):
+
+        return self._pigs_list
+
+    def read_picco2_files(self, filenames, callback):
+        """Read PiCCO2 files in a thread of the global thread pool.
+
+        The files are parsed concurrently by the worker while the GUI thread keeps processing its events. The progress bar is updated
+        and the callback is called with the readers through queued signals, hence on the GUI thread.
+
+        Args:
+            filenames (list of str): the PiCCO2 files to read
+            callback (callable): the function called with the readers of the files that could be read, in the order of the input files
+        """
+
+        if self._read_picco2_files_worker is not None:
+            logging.warning('Some files are already being loaded')
+            return
+
+        def on_finished(readers):
+            self._read_picco2_files_worker = None
+            callback(readers)
+
+        def on_failed(message):
+            self._read_picco2_files_worker = None
+
+        progress_bar.reset(len(filenames))
+
+        # The worker is kept alive until it completes, its signals being owned by it
+        self._read_picco2_files_worker = FunctionWorker(read_picco2_files, filenames)
+        self._read_picco2_files_worker.signals.progress.connect(progress_bar.update, QtCore.Qt.QueuedConnection)
+        self._read_picco2_files_worker.signals.finished.connect(on_finished, QtCore.Qt.QueuedConnection)
+        self._read_picco2_files_worker.signals.failed.connect(on_failed, QtCore.Qt.QueuedConnection)
+        QtCore.QThreadPool.globalInstance().start(self._read_picco2_files_worker)
+
     @property
     def selected_property(self):
 
@@ -3,10 +3,15 @@ from PyQt5 import QtCore, QtGui
 
 class PandasDataModel(QtCore.QAbstractTableModel):
 
+    # The background color of the rows which are not colored, shared by all the cells
+    default_background = QtGui.QColor('white')
+
     def __init__(self, data):
         super(PandasDataModel, self).__init__()
         self._data = data
-        self._colored_rows = {}
+        self._values = data.to_numpy()
+        self._display_columns = {}
+        self._colored_rows = (0, 0, None)
 
     def rowCount(self, parent=None):
         return self._data.shape[0]
@@ -17,9 +22,16 @@ class PandasDataModel(QtCore.QAbstractTableModel):
     def data(self, index, role=QtCore.Qt.DisplayRole):
         if index.isValid():
             if role == QtCore.Qt.DisplayRole:
-                return str(self._data.iloc[index.row(), index.column()])
+                column = index.column()
+                # The cells are formatted one column at a time when the column is painted for the first time
+                if column not in self._display_columns:
+                    self._display_columns[column] = self._values[:, column].astype(str).tolist()
+                return self._display_columns[column][index.row()]
             elif role == QtCore.Qt.BackgroundRole:
-                return self._colored_rows.get(index.row(), QtGui.QColor('white'))
+                row_min, row_max, color = self._colored_rows
+                if row_min <= index.row() < row_max:
+                    return color
+                return PandasDataModel.default_background
 
         return None
 
@@ -31,8 +43,36 @@ class PandasDataModel(QtCore.QAbstractTableModel):
                 return str(col)
         return None
 
-    def setColoredRows(self, rows):
+    def setDataFrame(self, data):
+        """Reset the model with new data.
+
+        Args:
+            data (pandas.DataFrame): the new data
+        """
+
+        self.beginResetModel()
+
+        self._data = data
+        self._values = data.to_numpy()
+        self._display_columns = {}
+        self._colored_rows = (0, 0, None)
+
+        self.endResetModel()
+
+    def setColoredRows(self, row_min, row_max, color):
+        """Set the background color of a range of rows.
+
+        Args:
+            row_min (int): the first row of the range
+            row_max (int): the last row of the range (excluded)
+            color (PyQt5.QtGui.QColor): the background color
+        """
+
+        previous_row_min, previous_row_max, _ = self._colored_rows
 
-        self._colored_rows = rows
+        self._colored_rows = (row_min, row_max, color)
 
-        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount(), self.columnCount()), [QtCore.Qt.BackgroundRole])
+        # Only the rows previously and newly colored need to be repainted
+        for first_row, last_row in [(previous_row_min, previous_row_max), (row_min, row_max)]:
+            if last_row > first_row:
+                self.dataChanged.emit(self.index(first_row, 0), self.index(last_row - 1, self.columnCount() - 1), [QtCore.Qt.BackgroundRole])
@@ -1,3 +1,4 @@
+import copy
 import logging
 
 import pandas as pd
@@ -25,8 +26,27 @@ class PigsGroupsModel(QtCore.QAbstractListModel):
 
         self._pigs_groups = PigsGroups()
 
+        # The names of the groups in row order, kept in sync with the groups such as the rows can be resolved without rebuilding it
+        self._group_names = []
+
         self._selected_groups = []
 
+        # The statistics computed so far for the current content of the groups. The dirty counter is bumped each time the content of the
+        # groups (their pigs and the record intervals of the pigs) changes, which outdates the statistics cached for a previous value.
+        self._statistics_cache = {}
+        self._dirty_counter = 0
+        self._statistics_cache_counter = 0
+
+    @property
+    def group_names(self):
+        """Returns the names of the groups stored in the model.
+
+        Returns:
+            list of str: the names of the groups
+        """
+
+        return list(self._group_names)
+
     def has_defined_intervals(self):
         """Check whether this group has defined intervals
         """
@@ -44,7 +64,7 @@ class PigsGroupsModel(QtCore.QAbstractListModel):
         """
         """
 
-        p_values = self._pigs_groups.premortem_statistics(n_last_intervals, selected_property=selected_property, selected_groups=selected_groups)
+        p_values = self.get_statistics('premortem_statistics', selected_property, selected_groups, n_last_intervals=n_last_intervals)
 
         return p_values
 
@@ -52,28 +72,28 @@ class PigsGroupsModel(QtCore.QAbstractListModel):
         """
         """
 
-        p_values = self._pigs_groups.evaluate_global_group_effect(selected_property=selected_property, selected_groups=selected_groups)
+        p_values = self.get_statistics('evaluate_global_group_effect', selected_property, selected_groups)
         return p_values
 
     def evaluate_pairwise_group_effect(self, selected_property='APs', selected_groups=None):
         """
         """
 
-        p_values = self._pigs_groups.evaluate_pairwise_group_effect(selected_property=selected_property, selected_groups=selected_groups)
+        p_values = self.get_statistics('evaluate_pairwise_group_effect', selected_property, selected_groups)
         return p_values
 
     def evaluate_global_time_effect(self, selected_property='APs', selected_groups=None):
         """
         """
 
-        p_values = self._pigs_groups.evaluate_global_time_effect(selected_property=selected_property, selected_groups=selected_groups)
+        p_values = self.get_statistics('evaluate_global_time_effect', selected_property, selected_groups)
         return p_values
 
     def evaluate_pairwise_time_effect(self, selected_property='APs', selected_groups=None):
         """
         """
 
-        p_values = self._pigs_groups.evaluate_pairwise_time_effect(selected_property=selected_property, selected_groups=selected_groups)
+        p_values = self.get_statistics('evaluate_pairwise_time_effect', selected_property, selected_groups)
         return p_values
 
     def add_group(self, group):
@@ -91,16 +111,68 @@ class PigsGroupsModel(QtCore.QAbstractListModel):
 
         try:
             self._pigs_groups.add_group(group, PigsPool())
+            self._group_names.append(group)
             self._selected_groups.append(True)
         except PigsGroupsError as error:
             logging.error(str(error))
 
         self.endInsertRows()
 
+        self.set_dirty()
+
+    def add_reader(self, group, reader):
+        """Add a reader to a group.
+
+        Args:
+            group (str): the group name
+            reader (inspigtor.kernel.readers.picco2_reader.PiCCO2FileReader): the reader
+        """
+
+        pigs_pool = self._pigs_groups.get_group(group)
+        if pigs_pool is None:
+            logging.error('The group {} does not exist'.format(group))
+            return
+
+        pigs_pool.add_reader(reader)
+
+        self.set_dirty()
+
     def get_group(self, group):
 
         return self._pigs_groups.get_group(group)
 
+    def get_statistics(self, statistics, selected_property, selected_groups, **kwargs):
+        """Compute some statistics over the groups or fetch them if they were already computed for the same inputs.
+
+        The cached statistics are dropped once the model is set dirty. A copy of the statistics is returned such as the caller can not
+        alter the cached ones.
+
+        Args:
+            statistics (str): the name of the inspigtor.kernel.pigs.pigs_groups.PigsGroups method which computes the statistics
+            selected_property (str): the selected property
+            selected_groups (list of str): the selected groups. If None, all the groups will be used.
+            kwargs (dict): the extra keyword arguments of the method
+
+        Returns:
+            the statistics
+        """
+
+        if self._statistics_cache_counter != self._dirty_counter:
+            self._statistics_cache = {}
+            self._statistics_cache_counter = self._dirty_counter
+
+        key = (statistics, selected_property, None if selected_groups is None else tuple(selected_groups), tuple(sorted(kwargs.items())))
+        if key in self._statistics_cache:
+            return copy.deepcopy(self._statistics_cache[key])
+
+        result = getattr(self._pigs_groups, statistics)(selected_property=selected_property, selected_groups=selected_groups, **kwargs)
+
+        # The failed computations are not cached such as their errors are reported each time they are run
+        if len(result) > 0:
+            self._statistics_cache[key] = result
+
+        return copy.deepcopy(result)
+
     def data(self, index, role):
         """
         """
@@ -108,18 +180,14 @@ class PigsGroupsModel(QtCore.QAbstractListModel):
         if not index.isValid():
             return QtCore.QVariant()
 
-        groups = self._pigs_groups.groups
-
-        group_names = list(groups.keys())
-
-        selected_group = group_names[index.row()]
+        selected_group = self._group_names[index.row()]
 
         if role == QtCore.Qt.DisplayRole:
             return selected_group
         elif role == QtCore.Qt.CheckStateRole:
             return QtCore.Qt.Checked if self._selected_groups[index.row()] else QtCore.Qt.Unchecked
         elif role == PigsGroupsModel.PigsPool:
-            return groups[selected_group]
+            return self._pigs_groups.get_group(selected_group)
         else:
             return QtCore.QVariant()
 
@@ -155,7 +223,7 @@ class PigsGroupsModel(QtCore.QAbstractListModel):
         """
         """
 
-        return [group_name for i, group_name in enumerate(self._pigs_groups.groups.keys()) if self._selected_groups[i]]
+        return [group_name for group_name, selected in zip(self._group_names, self._selected_groups) if selected]
 
     @ property
     def n_selected_groups(self):
@@ -170,4 +238,14 @@ class PigsGroupsModel(QtCore.QAbstractListModel):
 
         self._pigs_groups.remove_reader(filename)
 
+        self.set_dirty()
+
         self.layoutChanged.emit()
+
+    def set_dirty(self):
+        """Mark the statistics cached so far as outdated.
+
+        This must be called each time the content of the groups changes: pigs added to or removed from a group, new record intervals.
+        """
+
+        self._dirty_counter += 1
@@ -29,6 +29,9 @@ class PigsPoolModel(QtCore.QAbstractListModel):
         else:
             self._pigs_pool = pigs_pool
 
+        # The tooltips are built on demand and cached per pig
+        self._tooltips = {}
+
     def get_reader(self, filename):
 
         return self._pigs_pool.get_reader(filename)
@@ -49,30 +52,83 @@ class PigsPoolModel(QtCore.QAbstractListModel):
 
         self.endInsertRows()
 
+    def add_readers(self, readers):
+        """Add several readers to the internal pool with a single row insertion.
+
+        Args:
+            readers (list of inspigtor.kernel.readers.picco2_reader.PiCCO2FileReader): the readers
+        """
+
+        new_readers = {}
+        for reader in readers:
+            if self._pigs_pool.get_reader(reader.filename) is None:
+                new_readers.setdefault(reader.filename, reader)
+
+        if not new_readers:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(), self.rowCount(), self.rowCount() + len(new_readers) - 1)
+
+        for reader in new_readers.values():
+            self._pigs_pool.add_reader(reader)
+
+        self.endInsertRows()
+
     def remove_index(self, index):
         """Remove 
         """
 
-        pigs = self._pigs_pool.pigs
+        filename = self._pigs_pool.pig_names[index]
 
-        pig_names = list(pigs.keys())
+        self.remove_reader(filename)
 
-        filename = pig_names[index]
+    def remove_indexes(self, indexes):
+        """Remove several pigs from the model.
 
-        self.remove_reader(filename)
+        The rows are removed by runs of contiguous rows, from the last run to the first one, so that each run triggers a single rows removal.
 
-    def remove_reader(self, filename):
+        Args:
+            indexes (list of int): the rows of the pigs to remove
+        """
 
-        pigs = self._pigs_pool.pigs
+        rows = sorted(set(indexes), reverse=True)
+
+        pig_names = self._pigs_pool.pig_names
+
+        runs = []
+        for row in rows:
+            if runs and runs[-1][0] == row + 1:
+                runs[-1][0] = row
+            else:
+                runs.append([row, row])
 
-        pig_names = list(pigs.keys())
+        removed_filenames = []
+        for first_row, last_row in runs:
+            filenames = pig_names[first_row:last_row+1]
 
-        index = pig_names.index(filename)
+            self.beginRemoveRows(QtCore.QModelIndex(), first_row, last_row)
+
+            for filename in filenames:
+                self._pigs_pool.remove_reader(filename)
+                self._tooltips.pop(filename, None)
+
+            self.endRemoveRows()
+
+            removed_filenames.extend(filenames)
+
+        for filename in removed_filenames:
+            self.reader_removed.emit(filename)
+
+    def remove_reader(self, filename):
+
+        index = self._pigs_pool.pig_names.index(filename)
 
         self.beginRemoveRows(QtCore.QModelIndex(), index, index)
 
         self._pigs_pool.remove_reader(filename)
 
+        self._tooltips.pop(filename, None)
+
         self.endRemoveRows()
 
         self.reader_removed.emit(filename)
@@ -84,20 +140,18 @@ class PigsPoolModel(QtCore.QAbstractListModel):
         if not index.isValid():
             return QtCore.QVariant()
 
-        pigs = self._pigs_pool.pigs
-
-        pig_names = list(pigs.keys())
-
-        selected_pig = pig_names[index.row()]
-
-        reader = self._pigs_pool.get_reader(selected_pig)
+        selected_pig = self._pigs_pool.pig_names[index.row()]
 
+        # The reader is only looked up for the roles which need it, the display role being served from the pig name
         if role == QtCore.Qt.DisplayRole:
             return selected_pig
         elif role == QtCore.Qt.ToolTipRole:
-            return "\n".join([": ".join([k, v]) for k, v in reader.parameters.items()])
+            if selected_pig not in self._tooltips:
+                reader = self._pigs_pool.get_reader(selected_pig)
+                self._tooltips[selected_pig] = "\n".join("{}: {}".format(k, v) for k, v in reader.parameters.items())
+            return self._tooltips[selected_pig]
         elif role == PigsPoolModel.Reader:
-            return reader
+            return self._pigs_pool.get_reader(selected_pig)
         else:
             return QtCore.QVariant()
 
@@ -114,6 +168,26 @@ class PigsPoolModel(QtCore.QAbstractListModel):
 
         return pigs.get(pig_name, None)
 
+    @property
+    def pig_names(self):
+        """Returns the names of the pigs stored in the model.
+
+        Returns:
+            list of str: the names of the pigs
+        """
+
+        return list(self._pigs_pool.pig_names)
+
+    @property
+    def readers(self):
+        """Returns the readers stored in the model.
+
+        Returns:
+            list of inspigtor.kernel.readers.picco2_reader.PiCCO2FileReader: the readers, in the order of the rows
+        """
+
+        return list(self._pigs_pool.pigs.values())
+
     def rowCount(self, parent=None):
 
         return len(self._pigs_pool)
@@ -22,6 +22,10 @@ class PValuesDataModel(QtCore.QAbstractTableModel):
         super(PValuesDataModel, self).__init__()
         self._data = data
 
+        # The p values are read from a numpy view of the matrix and their display strings are built once
+        self._values = data.to_numpy()
+        self._display_values = [[str(v) for v in row] for row in self._values]
+
     def matrix(self):
 
         return self._data
@@ -51,11 +55,9 @@ class PValuesDataModel(QtCore.QAbstractTableModel):
 
         if index.isValid():
             if role == QtCore.Qt.DisplayRole:
-                return str(self._data.iloc[index.row(), index.column()])
+                return self._display_values[index.row()][index.column()]
             elif role == QtCore.Qt.ForegroundRole:
-                row = index.row()
-                column = index.column()
-                p_value = self._data.iloc[row, column]
+                p_value = self._values[index.row(), index.column()]
                 if p_value < 0.05 and p_value > 0:
                     return QtGui.QBrush(QtCore.Qt.red)
 
@@ -0,0 +1,75 @@
+from PyQt5 import QtCore, QtGui
+
+
+class RecordIntervalsModel(QtCore.QAbstractListModel):
+    """This model describes the record intervals of a pig.
+    """
+
+    Interval = QtCore.Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        """Constructor.
+
+        Args:
+            parent (PyQt5.QtWidgets.QObject): the parent object
+        """
+
+        super(RecordIntervalsModel, self).__init__(parent)
+
+        self._record_intervals = []
+
+        self._timeline = []
+
+        self._record_times = []
+
+        self._t_initial_interval_index = None
+
+    def data(self, index, role):
+        """Returns the data for a given record interval and role.
+
+        Args:
+            index (PyQt5.QtCore.QModelIndex): the index of the record interval
+            role (int): the role
+
+        Returns:
+            the data for the given role
+        """
+
+        if not index.isValid():
+            return QtCore.QVariant()
+
+        row = index.row()
+
+        if role == QtCore.Qt.DisplayRole:
+            return self._timeline[row]
+        elif role == QtCore.Qt.ToolTipRole:
+            return " - ".join(self._record_times[row])
+        elif role == QtCore.Qt.ForegroundRole:
+            if row == self._t_initial_interval_index:
+                return QtGui.QBrush(QtCore.Qt.red)
+            return QtCore.QVariant()
+        elif role == RecordIntervalsModel.Interval:
+            return self._record_intervals[row]
+        else:
+            return QtCore.QVariant()
+
+    def rowCount(self, parent=None):
+
+        return len(self._record_intervals)
+
+    def set_reader(self, reader, record_intervals):
+        """Reset the model with the record intervals of a pig.
+
+        Args:
+            reader (inspigtor.kernel.readers.picco2_reader.PiCCO2FileReader): the reader of the pig
+            record_intervals (list of 2-tuples): the record intervals
+        """
+
+        self.beginResetModel()
+
+        self._record_intervals = list(record_intervals)
+        self._timeline = reader.timeline
+        self._record_times = reader.record_times
+        self._t_initial_interval_index = reader.t_initial_interval_index
+
+        self.endResetModel()
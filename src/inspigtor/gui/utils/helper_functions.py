@@ -1,8 +1,6 @@
 import csv
 import io
 
-from pdb import set_trace
-
 from PyQt5 import QtCore, QtWidgets
 
 
@@ -23,13 +21,27 @@ def debug_trace():
     """Set a tracepoint in the Python debugger that works with Qt
     """
 
+    # The debugger is only imported when a tracepoint is actually set
+    from pdb import set_trace
+
     QtCore.pyqtRemoveInputHook()
     set_trace()
 
 
 def func_formatter(tick_val, tick_pos, labels):
+    """Return the label of a tick located by its index.
+
+    Args:
+        tick_val (float): the value of the tick
+        tick_pos (int): the position of the tick
+        labels (sequence of str): the labels
+
+    Returns:
+        str: the label of the tick (empty if the tick is out of the labels range)
+    """
+
     int_tick_val = int(round(tick_val))
-    if int_tick_val in range(len(labels)):
+    if 0 <= int_tick_val < len(labels):
         return labels[int_tick_val]
     else:
         return ''
@@ -10,6 +10,13 @@ class DoubleClickableListView(QtWidgets.QListView):
 
     double_clicked_empty = QtCore.pyqtSignal()
 
+    def __init__(self, *args, **kwargs):
+
+        super(DoubleClickableListView, self).__init__(*args, **kwargs)
+
+        # Whether the model of the view is empty, kept up to date through the model's signals
+        self._is_empty = True
+
     def mouseDoubleClickEvent(self, event):
         """Event called when the user double click on the empty list view.
 
@@ -17,7 +24,7 @@ class DoubleClickableListView(QtWidgets.QListView):
             event (PyQt5.QtCore.QEvent): the double click event.
         """
 
-        if self.model().rowCount() == 0:
+        if self._is_empty:
             self.double_clicked_empty.emit()
 
         return super(DoubleClickableListView, self).mouseDoubleClickEvent(event)
@@ -32,5 +39,34 @@ class DoubleClickableListView(QtWidgets.QListView):
 
         if event.key() == QtCore.Qt.Key_Delete:
 
-            for sel_index in reversed(self.selectedIndexes()):
-                self.model().remove_index(sel_index.row())
+            model.remove_indexes([sel_index.row() for sel_index in self.selectedIndexes()])
+
+    def on_update_is_empty(self):
+        """Event fired when rows are inserted in or removed from the model of the view.
+        """
+
+        model = self.model()
+
+        self._is_empty = model is None or model.rowCount() == 0
+
+    def setModel(self, model):
+        """Set the model of the view.
+
+        Args:
+            model (PyQt5.QtCore.QAbstractItemModel): the model
+        """
+
+        previous_model = self.model()
+        if previous_model is not None:
+            previous_model.rowsInserted.disconnect(self.on_update_is_empty)
+            previous_model.rowsRemoved.disconnect(self.on_update_is_empty)
+            previous_model.modelReset.disconnect(self.on_update_is_empty)
+
+        super(DoubleClickableListView, self).setModel(model)
+
+        if model is not None:
+            model.rowsInserted.connect(self.on_update_is_empty)
+            model.rowsRemoved.connect(self.on_update_is_empty)
+            model.modelReset.connect(self.on_update_is_empty)
+
+        self.on_update_is_empty()
@@ -40,11 +40,12 @@ class DroppableListView(QtWidgets.QListView):
 
         if event.key() == QtCore.Qt.Key_Delete:
 
-            for sel_index in reversed(self.selectedIndexes()):
-                self.model().remove_reader(sel_index.data(QtCore.Qt.DisplayRole))
-                if self.model().rowCount() > 0:
-                    index = self.model().index(self.model().rowCount()-1)
-                    self.setCurrentIndex(index)
+            model = self.model()
+
+            model.remove_indexes([sel_index.row() for sel_index in self.selectedIndexes()])
+            if model.rowCount() > 0:
+                index = model.index(model.rowCount()-1)
+                self.setCurrentIndex(index)
 
         else:
-            super(PigsPoolListView, self).keyPressEvent(event)
+            super(DroppableListView, self).keyPressEvent(event)
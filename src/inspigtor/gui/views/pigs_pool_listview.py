@@ -26,11 +26,8 @@ class PigsPoolListView(DroppableListView):
             return
 
         # Drop only those items which are not present in this widget
-        current_items = [target_model.data(target_model.index(i), QtCore.Qt.DisplayRole) for i in range(target_model.rowCount())]
+        current_items = set(target_model.pig_names)
         dragged_items = [source_model.item(i, 0).text() for i in range(source_model.rowCount())]
-        for pig_name in dragged_items:
-            if pig_name in current_items:
-                continue
+        readers = [self._pigs_model.get_reader(pig_name) for pig_name in dragged_items if pig_name not in current_items]
 
-            reader = self._pigs_model.get_reader(pig_name)
-            target_model.add_reader(reader)
+        target_model.add_readers([reader for reader in readers if reader is not None])
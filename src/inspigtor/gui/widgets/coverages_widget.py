@@ -1,15 +1,16 @@
 """This module implements the class CoveragesWidget.
 """
 
+import numpy as np
+
 from PyQt5 import QtWidgets
 
 import matplotlib.ticker as ticker
-from pylab import Figure
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 
 from inspigtor.gui.utils.helper_functions import func_formatter
 from inspigtor.gui.utils.navigation_toolbar import NavigationToolbarWithExportButton
-from inspigtor.kernel.utils.helper_functions import build_timeline
 
 
 class CoveragesWidget(QtWidgets.QWidget):
@@ -23,7 +24,11 @@ class CoveragesWidget(QtWidgets.QWidget):
 
         super(CoveragesWidget, self).__init__(parent)
 
-        self.init_ui()
+        # The figure is built the first time the widget is shown (see showEvent)
+        self._figure = None
+
+        # The last coverage plot requested before the figure was built
+        self._pending_coverage_plot = None
 
     def build_layout(self):
         """Build the layout.
@@ -47,6 +52,12 @@ class CoveragesWidget(QtWidgets.QWidget):
         self._axes = self._figure.add_subplot(111)
         self._axes.set_ylabel('coverage')
         self._canvas = FigureCanvasQTAgg(self._figure)
+
+        # The coverage line is built once and only its data are updated when a new pig or property is selected
+        self._timeline = []
+        self._plot = self._axes.plot([], [])[0]
+        self._axes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda tick_val, tick_pos: func_formatter(tick_val, tick_pos, self._timeline)))
+        self._axes.tick_params(axis='x', labelsize=6)
         self._toolbar = NavigationToolbarWithExportButton(self._canvas, self)
 
     def init_ui(self):
@@ -57,6 +68,25 @@ class CoveragesWidget(QtWidgets.QWidget):
 
         self.build_layout()
 
+    def showEvent(self, event):
+        """Event fired when the widget is shown.
+
+        The figure, the canvas and the toolbar are built the first time the widget is shown so that the construction of the main window
+        does not wait for them.
+
+        Args:
+            event (PyQt5.QtGui.QShowEvent): the show event
+        """
+
+        if self._figure is None:
+            self.init_ui()
+
+            if self._pending_coverage_plot is not None:
+                self.update_coverage_plot(*self._pending_coverage_plot)
+                self._pending_coverage_plot = None
+
+        super(CoveragesWidget, self).showEvent(event)
+
     def update_coverage_plot(self, reader, selected_property):
         """Update the coverage plot
 
@@ -65,21 +95,28 @@ class CoveragesWidget(QtWidgets.QWidget):
             selected_property: the selected property
         """
 
+        if self._figure is None:
+            self._pending_coverage_plot = (reader, selected_property)
+            return
+
         coverages = reader.get_coverages(selected_property)
 
         if not coverages:
             return
 
-        self._axes.clear()
+        self._timeline = reader.timeline
 
-        timeline = reader.timeline
+        self._plot.set_data(np.arange(len(coverages)), coverages)
 
-        self._axes.plot(timeline, coverages)
-        loc = ticker.IndexLocator(base=10.0, offset=reader.t_initial_interval_index)
-        self._axes.xaxis.set_major_locator(loc)
-        for tick in self._axes.xaxis.get_major_ticks():
-            tick.label.set_fontsize(6)
+        # The index locator is set only once the line has data, its ticks being computed from the x data interval of the axes
+        locator = self._axes.xaxis.get_major_locator()
+        if isinstance(locator, ticker.IndexLocator):
+            locator.set_params(offset=reader.t_initial_interval_index)
+        else:
+            self._axes.xaxis.set_major_locator(ticker.IndexLocator(base=10.0, offset=reader.t_initial_interval_index))
 
-        self._axes.set_ylabel('coverage')
+        self._axes.relim()
+        self._axes.autoscale_view()
 
-        self._canvas.draw()
+        # Schedule the rendering for the next event loop iteration, several updates in a row being rendered only once
+        self._canvas.draw_idle()
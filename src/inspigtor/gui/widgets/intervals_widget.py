@@ -1,11 +1,15 @@
+import logging
 import re
 
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
 from inspigtor.gui.dialogs.interval_settings_dialog import IntervalSettingsDialog
+from inspigtor.gui.models.record_intervals_model import RecordIntervalsModel
 from inspigtor.gui.utils.helper_functions import find_main_window
 from inspigtor.gui.widgets.coverages_widget import CoveragesWidget
 from inspigtor.gui.widgets.interval_label import IntervalLabel
+from inspigtor.gui.workers.function_worker import FunctionWorker
+from inspigtor.kernel.readers.picco2_reader import set_record_intervals
 from inspigtor.kernel.utils.progress_bar import progress_bar
 
 
@@ -17,6 +21,8 @@ class IntervalsWidget(QtWidgets.QWidget):
 
     update_properties = QtCore.pyqtSignal(list)
 
+    record_intervals_updated = QtCore.pyqtSignal()
+
     def __init__(self, pigs_model, parent=None):
         """Constructor
 
@@ -29,6 +35,8 @@ class IntervalsWidget(QtWidgets.QWidget):
 
         self._pigs_model = pigs_model
 
+        self._set_record_intervals_worker = None
+
         self.init_ui()
 
     def build_events(self):
@@ -37,6 +45,7 @@ class IntervalsWidget(QtWidgets.QWidget):
 
         self._clear_intervals_settings_button.clicked.connect(self.on_clear_interval_settings)
         self._add_intervals_settings_button.clicked.connect(self.on_add_interval_settings)
+        self._intervals_list.selectionModel().currentChanged.connect(self.on_select_interval)
 
     def build_layout(self):
         """Build the layout.
@@ -81,7 +90,7 @@ class IntervalsWidget(QtWidgets.QWidget):
         self._add_intervals_settings_button = QtWidgets.QPushButton('Set interval')
 
         self._intervals_list = QtWidgets.QListView()
-        model = QtGui.QStandardItemModel()
+        model = RecordIntervalsModel(self)
         self._intervals_list.setModel(model)
         self._intervals_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
 
@@ -139,19 +148,51 @@ class IntervalsWidget(QtWidgets.QWidget):
         if main_window is None:
             return
 
-        n_pigs = self._pigs_model.rowCount()
-        if n_pigs == 0:
+        # The readers are fetched directly from the model instead of going through one index/data round-trip per pig
+        readers = self._pigs_model.readers
+        if not readers:
             return
 
-        progress_bar.reset(n_pigs)
+        if self._set_record_intervals_worker is not None:
+            logging.warning('The record intervals are already being searched')
+            return
+
+        # The record intervals of the pigs are searched concurrently in a worker thread. The widgets of the main window are disabled
+        # until the search completes such as the readers are not read while they are updated.
+        main_window.centralWidget().setEnabled(False)
+
+        progress_bar.reset(len(readers))
+
+        self._set_record_intervals_worker = FunctionWorker(set_record_intervals, readers, interval_settings)
+        self._set_record_intervals_worker.signals.progress.connect(progress_bar.update, QtCore.Qt.QueuedConnection)
+        self._set_record_intervals_worker.signals.finished.connect(self.on_record_intervals_set)
+        self._set_record_intervals_worker.signals.failed.connect(self.on_record_intervals_set)
+        QtCore.QThreadPool.globalInstance().start(self._set_record_intervals_worker)
+
+    def on_record_intervals_set(self, *args):
+        """Event fired when the search of the record intervals started by search_record_intervals completes or fails.
+
+        Args:
+            args (list): the result or the error message of the worker
+        """
+
+        self._set_record_intervals_worker = None
+
+        self.record_intervals_updated.emit()
+
+        main_window = find_main_window()
+        if main_window is None:
+            return
 
-        for row in range(n_pigs):
-            index = self._pigs_model.index(row, 0)
-            reader = self._pigs_model.data(index, self._pigs_model.Reader)
-            reader.set_record_interval(interval_settings)
-            progress_bar.update(row+1)
+        main_window.centralWidget().setEnabled(True)
 
-        main_window.on_select_pig(self._pigs_model.index(0, 0))
+        # Refresh the pig currently selected, selecting the first one if none is (which will trigger the refresh)
+        pigs_list = main_window.pigs_list
+        current_index = pigs_list.currentIndex()
+        if current_index.isValid():
+            main_window.on_select_pig(current_index)
+        else:
+            pigs_list.setCurrentIndex(self._pigs_model.index(0, 0))
 
     def on_select_interval(self, index):
         """Event handler for interval selection.
@@ -164,9 +205,7 @@ class IntervalsWidget(QtWidgets.QWidget):
 
         model = self._intervals_list.model()
 
-        item = model.item(index.row(), index.column())
-
-        row_min, row_max = item.data()
+        row_min, row_max = model.data(index, model.Interval)
 
         self.record_interval_selected.emit(row_min, row_max)
 
@@ -178,23 +217,9 @@ class IntervalsWidget(QtWidgets.QWidget):
             record_intervals (list of tuples): the record intervals
         """
 
-        # Update the record intervals list view
-        model = QtGui.QStandardItemModel()
-        self._intervals_list.setModel(model)
-        self._intervals_list.selectionModel().currentChanged.connect(self.on_select_interval)
-
-        record_times = reader.record_times
-        timeline = reader.timeline
-        for i, interval in enumerate(record_intervals):
-            item = QtGui.QStandardItem(timeline[i])
-            item.setData(interval)
-            item.setData(" - ".join(record_times[i]), QtCore.Qt.ToolTipRole)
-            model.appendRow(item)
-
-        self.update_properties.emit(list(reader.data.columns))
+        # The intervals model is reused from one pig to another and is simply reset with the intervals of the new pig
+        self._intervals_list.model().set_reader(reader, record_intervals)
 
-        t_initial_interval_index = reader.t_initial_interval_index
-        index = model.index(t_initial_interval_index, 0)
-        model.setData(index, QtGui.QBrush(QtCore.Qt.red), QtCore.Qt.ForegroundRole)
+        self.update_properties.emit(list(reader.properties))
 
         self._coverages_widget.update_coverage_plot(reader, self._pigs_model.selected_property)
@@ -32,6 +32,13 @@ class EnhancedTextEdit(QtWidgets.QPlainTextEdit):
             fin.write(self.toPlainText())
 
 
+class LogMessageEmitter(QtCore.QObject):
+    """This class forwards the log messages to the logger widget through a signal.
+    """
+
+    message_logged = QtCore.pyqtSignal(str)
+
+
 class QTextEditLogger(logging.Handler):
     def __init__(self, parent):
 
@@ -39,12 +46,16 @@ class QTextEditLogger(logging.Handler):
         self._widget = EnhancedTextEdit(parent)
         self._widget.setReadOnly(True)
 
+        # The records can be emitted from worker threads. Going through a signal queues them to the GUI thread which owns the widget.
+        self._emitter = LogMessageEmitter()
+        self._emitter.message_logged.connect(self._widget.appendPlainText)
+
     def emit(self, record):
         """
         """
 
         msg = self.format(record)
-        self._widget.appendPlainText(msg)
+        self._emitter.message_logged.emit(msg)
 
     @property
     def widget(self):
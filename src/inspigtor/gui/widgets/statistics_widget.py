@@ -262,11 +262,23 @@ class StatisticsWidget(QtWidgets.QWidget):
         """Event fired when the user click on Groups -> Import from directories menu button.
         """
 
+        groups_model = self._groups_list.model()
+
         for group, files in groups.items():
             self.on_add_group(group)
+            # The group is filled with the readers looked up by filename in the loaded pigs
             for filename in files:
-                pigs_pool = self._groups_list.model().get_group(group)
-                pigs_pool.add_reader(self._pigs_model.get_reader(filename))
+                reader = self._pigs_model.get_reader(filename)
+                if reader is None:
+                    logging.warning('The file {} is not loaded. Skip it.'.format(filename))
+                    continue
+                groups_model.add_reader(group, reader)
+
+    def on_update_record_intervals(self):
+        """Event fired when the record intervals of the pigs have been searched.
+        """
+
+        self._groups_list.model().set_dirty()
 
     def on_select_group(self, index):
         """Updates the individuals list view.
@@ -281,6 +293,10 @@ class StatisticsWidget(QtWidgets.QWidget):
 
         pigs_pool_model = PigsPoolModel(self, current_pig_pool)
 
+        # The pigs dropped in or removed from the group change the statistics of the groups
+        pigs_pool_model.rowsInserted.connect(groups_model.set_dirty)
+        pigs_pool_model.rowsRemoved.connect(groups_model.set_dirty)
+
         self._individuals_list.setModel(pigs_pool_model)
 
     def on_remove_reader(self, filename):
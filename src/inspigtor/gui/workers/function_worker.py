@@ -0,0 +1,65 @@
+"""This module implements the class FunctionWorker.
+"""
+
+import logging
+
+from PyQt5 import QtCore
+
+
+class FunctionWorkerSignals(QtCore.QObject):
+    """This class implements the signals emitted by a FunctionWorker.
+
+    A QRunnable is not a QObject and can not define signals on its own.
+    """
+
+    progress = QtCore.pyqtSignal(int)
+
+    finished = QtCore.pyqtSignal(object)
+
+    failed = QtCore.pyqtSignal(str)
+
+
+class FunctionWorker(QtCore.QRunnable):
+    """This class implements a worker which runs a function in a thread of a QThreadPool.
+
+    The function must accept a progress_callback keyword argument which it calls with the number of steps done so far. The progress,
+    the result and the error of the function are reported through signals, which are queued to the GUI thread.
+    """
+
+    def __init__(self, function, *args):
+        """Constructor.
+
+        Args:
+            function (callable): the function to run
+            args (list): the positional arguments of the function
+        """
+
+        super(FunctionWorker, self).__init__()
+
+        self._function = function
+
+        self._args = args
+
+        self._signals = FunctionWorkerSignals()
+
+    def run(self):
+        """Run the function.
+        """
+
+        try:
+            result = self._function(*self._args, progress_callback=self._signals.progress.emit)
+        except Exception as error:
+            logging.error(str(error))
+            self._signals.failed.emit(str(error))
+        else:
+            self._signals.finished.emit(result)
+
+    @property
+    def signals(self):
+        """Return the signals emitted by the worker.
+
+        Returns:
+            FunctionWorkerSignals: the signals
+        """
+
+        return self._signals
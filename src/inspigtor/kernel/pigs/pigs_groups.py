@@ -1,4 +1,4 @@
-import collections
+import concurrent.futures
 import logging
 
 import openpyxl
@@ -12,7 +12,7 @@ import scipy.stats as stats
 import scikit_posthocs as sk
 
 from inspigtor.kernel.pigs.pigs_pool import PigsPoolError
-from inspigtor.kernel.utils.stats import statistical_functions
+from inspigtor.kernel.utils.stats import rowwise_kruskal, statistical_functions
 from inspigtor.kernel.utils.progress_bar import progress_bar
 
 
@@ -29,7 +29,7 @@ class PigsGroups:
         """Constructor
         """
 
-        self._groups = collections.OrderedDict()
+        self._groups = {}
 
     def __contains__(self, group):
 
@@ -83,7 +83,7 @@ class PigsGroups:
         longest_timeline = []
 
         progress_bar.reset(len(selected_groups))
-        averages_per_group = collections.OrderedDict()
+        averages_per_group = {}
         for i, group in enumerate(selected_groups):
             try:
                 timeline, averages_per_group[group] = self._groups[group].get_statistics(
@@ -101,39 +101,48 @@ class PigsGroups:
             logging.error('There is less than two groups. Can not perform any global statistical test.')
             return pd.DataFrame([])
 
+        # The Kruskal-Wallis tests are performed for all the intervals in one go, the averages of the groups being stacked side by side
+        if len(averages_per_group) > 2:
+            n_pigs_per_group = [averages.shape[1] for averages in averages_per_group.values()]
+            stacked_averages = np.full((len(longest_timeline), sum(n_pigs_per_group)), np.nan)
+            first_column = 0
+            for averages in averages_per_group.values():
+                stacked_averages[:averages.shape[0], first_column:first_column+averages.shape[1]] = averages
+                first_column += averages.shape[1]
+            kruskal_p_values = rowwise_kruskal(stacked_averages, n_pigs_per_group)
+
+        # The mean, the standard deviation and the number of the valid averages of each group are computed for all the intervals in one go
+        statistics_per_group = []
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for averages in averages_per_group.values():
+                valid = ~np.isnan(averages)
+                n_values = valid.sum(axis=1)
+                means = np.where(valid, averages, 0.0).sum(axis=1)/n_values
+                stds = np.sqrt((np.where(valid, averages - means[:, np.newaxis], 0.0)**2).sum(axis=1)/n_values)
+                statistics_per_group.append((means, stds, n_values))
+
         progress_bar.reset(len(longest_timeline))
 
         p_values_per_time = []
         # Loop over the intervals
         for i, _ in enumerate(longest_timeline):
-            groups = []
             n_values_per_group = []
             uncomplete_group = False
-            for averages in averages_per_group.values():
-                # This interval is not defined for this group, skip the group
-                if i >= averages.shape[0]:
+            for means, stds, n_values in statistics_per_group:
+                # This interval is not defined for this group or has no valid average, skip the group
+                if i >= len(n_values) or n_values[i] == 0:
                     uncomplete_group = True
                     n_values_per_group.append((np.nan, np.nan, 0))
                 else:
-                    values = [v for v in averages[i, :] if not np.isnan(v)]
-                    if not values:
-                        uncomplete_group = True
-                        n_values_per_group.append((np.nan, np.nan, 0))
-                    else:
-                        groups.append(values)
-                        n_values_per_group.append((np.nanmean(values), np.nanstd(values), len(values)))
+                    n_values_per_group.append((means[i], stds[i], n_values[i]))
 
             if uncomplete_group:
                 p_value = np.nan
+            elif len(averages_per_group) == 2:
+                groups = [averages[i, ~np.isnan(averages[i, :])] for averages in averages_per_group.values()]
+                p_value = stats.mannwhitneyu(*groups, alternative='two-sided').pvalue
             else:
-                n_groups = len(groups)
-                if n_groups < 2:
-                    p_value = np.nan
-                else:
-                    if n_groups == 2:
-                        p_value = stats.mannwhitneyu(*groups, alternative='two-sided').pvalue
-                    else:
-                        p_value = stats.kruskal(*groups).pvalue
+                p_value = kruskal_p_values[i]
 
             n_values_per_group = [vv for v in n_values_per_group for vv in v]
 
@@ -174,19 +183,22 @@ class PigsGroups:
             return pd.DataFrame([])
 
         progress_bar.reset(len(selected_groups))
-        valid_groups = []
-        p_values = []
-        for i, group in enumerate(selected_groups):
-            try:
-                _, p_value = self._groups[group].evaluate_global_time_effect(selected_property=selected_property, interval_indexes=interval_indexes)
-            except PigsPoolError:
-                logging.error('Can not evaluate global time effect for group {}'.format(group))
-                continue
-            else:
-                valid_groups.append(group)
-                p_values.append(p_value)
-            finally:
-                progress_bar.update(i+1)
+        p_values_per_group = {}
+        # The Friedman tests of the groups are independent and are run concurrently
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = {executor.submit(self._groups[group].evaluate_global_time_effect, selected_property=selected_property,
+                                       interval_indexes=interval_indexes): group for group in selected_groups}
+            for progress, future in enumerate(concurrent.futures.as_completed(futures)):
+                group = futures[future]
+                try:
+                    _, p_values_per_group[group] = future.result()
+                except PigsPoolError:
+                    logging.error('Can not evaluate global time effect for group {}'.format(group))
+                finally:
+                    progress_bar.update(progress+1)
+
+        valid_groups = [group for group in selected_groups if group in p_values_per_group]
+        p_values = [p_values_per_group[group] for group in valid_groups]
 
         if not p_values:
             logging.error('The time effect could not be evaluated for any of the groups')
@@ -223,17 +235,17 @@ class PigsGroups:
 
         if len(selected_groups) < 2:
             logging.error('There is less than two groups. Can not perform any global statistical test.')
-            return collections.OrderedDict()
+            return {}
 
         longest_timeline = []
-        averages_per_group = collections.OrderedDict()
+        averages_per_group = {}
         for i, group in enumerate(selected_groups):
             try:
                 timeline, averages_per_group[group] = self._groups[group].get_statistics(
                     selected_property, selected_statistics='mean', interval_indexes=interval_indexes)
             except PigsPoolError as error:
                 logging.error(str(error))
-                return collections.OrderedDict()
+                return {}
             else:
                 if len(timeline) > len(longest_timeline):
                     longest_timeline = timeline
@@ -242,31 +254,42 @@ class PigsGroups:
 
         if not averages_per_group:
             logging.error('There is less than two groups. Can not perform any global statistical test.')
-            return collections.OrderedDict()
-
-        progress_bar.reset(len(longest_timeline))
-        p_values = collections.OrderedDict()
-        # Loop over the intervals
-        for i, time in enumerate(longest_timeline):
-            uncomplete_group = False
-            groups = []
-            for averages in averages_per_group.values():
-                # This interval is not defined for this group, skip the group
-                if i >= averages.shape[0]:
-                    uncomplete_group = True
-                else:
-                    values = [v for v in averages[i, :] if not np.isnan(v)]
-                    if not values:
+            return {}
+
+        p_values = {}
+        # The Dunn tests of the intervals are independent and are run concurrently
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = {}
+            # Loop over the intervals
+            for i, time in enumerate(longest_timeline):
+                uncomplete_group = False
+                groups = []
+                for averages in averages_per_group.values():
+                    # This interval is not defined for this group, skip the group
+                    if i >= averages.shape[0]:
                         uncomplete_group = True
                     else:
-                        groups.append(values)
-
-            if uncomplete_group or len(groups) < 2:
-                p_values[time] = pd.DataFrame(np.nan, index=group_names, columns=group_names)
-            else:
-                p_values[time] = pd.DataFrame(sk.posthoc_dunn(groups).to_numpy(), index=group_names, columns=group_names)
-
-            progress_bar.update(i+1)
+                        values = [v for v in averages[i, :] if not np.isnan(v)]
+                        if not values:
+                            uncomplete_group = True
+                        else:
+                            groups.append(values)
+
+                if uncomplete_group or len(groups) < 2:
+                    p_values[time] = pd.DataFrame(np.nan, index=group_names, columns=group_names)
+                else:
+                    # Reserve the slot of the interval such as the p values remain sorted by interval
+                    p_values[time] = None
+                    futures[executor.submit(sk.posthoc_dunn, groups)] = time
+
+            progress_bar.reset(len(futures))
+            for progress, future in enumerate(concurrent.futures.as_completed(futures)):
+                # The data frame returned by the Dunn test is relabelled in place instead of being copied
+                dunn_p_values = future.result()
+                dunn_p_values.index = group_names
+                dunn_p_values.columns = group_names
+                p_values[futures[future]] = dunn_p_values
+                progress_bar.update(progress+1)
 
         return p_values
 
@@ -292,20 +315,24 @@ class PigsGroups:
 
         if not selected_groups:
             logging.error('There is less than one group. Can not perform any global statistical test.')
-            return collections.OrderedDict()
+            return {}
 
         progress_bar.reset(len(selected_groups))
-        valid_groups = collections.OrderedDict()
-        for i, group in enumerate(selected_groups):
-            try:
-                p_values = self._groups[group].evaluate_pairwise_time_effect(
-                    selected_property=selected_property, interval_indexes=interval_indexes)
-            except PigsPoolError:
-                logging.error('Can not evaluate pairwise time effect for group {}'.format(group))
-            else:
-                valid_groups[group] = p_values
-            finally:
-                progress_bar.update(i+1)
+        p_values_per_group = {}
+        # The Dunn tests of the groups are independent and are run concurrently
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = {executor.submit(self._groups[group].evaluate_pairwise_time_effect, selected_property=selected_property,
+                                       interval_indexes=interval_indexes): group for group in selected_groups}
+            for progress, future in enumerate(concurrent.futures.as_completed(futures)):
+                group = futures[future]
+                try:
+                    p_values_per_group[group] = future.result()
+                except PigsPoolError:
+                    logging.error('Can not evaluate pairwise time effect for group {}'.format(group))
+                finally:
+                    progress_bar.update(progress+1)
+
+        valid_groups = {group: p_values_per_group[group] for group in selected_groups if group in p_values_per_group}
 
         return valid_groups
 
@@ -326,9 +353,8 @@ class PigsGroups:
             all_groups = set(self._groups.keys())
             selected_groups = [group for group in selected_groups if group in all_groups]
 
-        workbook = openpyxl.Workbook()
-        # Remove the first empty sheet created by default
-        workbook.remove_sheet(workbook.get_sheet_by_name('Sheet'))
+        # The workbook is streamed row by row to the file instead of being built cell by cell in memory
+        workbook = openpyxl.Workbook(write_only=True)
 
         for group in selected_groups:
 
@@ -340,13 +366,7 @@ class PigsGroups:
                 return
 
             # Create the excel worksheet
-            workbook.create_sheet(group)
-            worksheet = workbook.get_sheet_by_name(group)
-
-            worksheet.cell(row=1, column=1).value = 'time'
-            worksheet.cell(row=1, column=12).value = 'selected property'
-            worksheet.cell(row=2, column=12).value = selected_property
-            worksheet.cell(row=1, column=14).value = 'pigs'
+            worksheet = workbook.create_sheet(group)
 
             longest_timeline = []
             for reader in self._groups[group].pigs.values():
@@ -354,17 +374,24 @@ class PigsGroups:
                 if len(timeline) > len(longest_timeline):
                     longest_timeline = timeline
 
-            # Add titles
-            for col, func in enumerate(statistical_functions.keys()):
-                worksheet.cell(row=1, column=col+2).value = func
-
-                for row, value in enumerate(reduced_averages[func]):
-                    worksheet.cell(row=row+2, column=1).value = longest_timeline[row]
-                    worksheet.cell(row=row+2, column=col+2).value = value
-
-            pigs = self._groups[group].pigs.keys()
-            for row, pig in enumerate(pigs):
-                worksheet.cell(row=row+2, column=14).value = pig
+            # The times and the statistics fill the first columns, the selected property the 12th column and the pigs the 14th column
+            statistics = list(statistical_functions.keys())
+            n_intervals = len(reduced_averages[statistics[0]])
+            pigs = list(self._groups[group].pigs.keys())
+
+            worksheet.append(['time'] + statistics + [None]*(10 - len(statistics)) + ['selected property', None, 'pigs'])
+
+            for row in range(max(n_intervals, len(pigs), 1)):
+                cells = [None]*14
+                if row < n_intervals:
+                    cells[0] = longest_timeline[row]
+                    for col, func in enumerate(statistics):
+                        cells[col+1] = reduced_averages[func][row]
+                if row == 0:
+                    cells[11] = selected_property
+                if row < len(pigs):
+                    cells[13] = pigs[row]
+                worksheet.append(cells)
 
         try:
             workbook.save(filename)
@@ -410,17 +437,20 @@ class PigsGroups:
 
         if not selected_groups:
             logging.error('There is less than one group. Can not perform any global statistical test.')
-            return collections.OrderedDict()
+            return {}
 
         progress_bar.reset(len(selected_groups))
-        global_and_pairwise_effects = []
-        for i, group in enumerate(selected_groups):
-            p_values = self._groups[group].premortem_statistics(n_last_intervals, selected_property=selected_property)
-            friedmann_p_value, dunn_p_values = p_values
-            global_and_pairwise_effects.append((friedmann_p_value, dunn_p_values))
-            progress_bar.update(i+1)
-
-        return collections.OrderedDict(zip(selected_groups, global_and_pairwise_effects))
+        global_and_pairwise_effects = {}
+        # The Friedman and Dunn tests of the groups are independent and are run concurrently
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = {executor.submit(self._groups[group].premortem_statistics, n_last_intervals,
+                                       selected_property=selected_property): group for group in selected_groups}
+            for progress, future in enumerate(concurrent.futures.as_completed(futures)):
+                friedmann_p_value, dunn_p_values = future.result()
+                global_and_pairwise_effects[futures[future]] = (friedmann_p_value, dunn_p_values)
+                progress_bar.update(progress+1)
+
+        return {group: global_and_pairwise_effects[group] for group in selected_groups}
 
     def remove_reader(self, filename):
         """
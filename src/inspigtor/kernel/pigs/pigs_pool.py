@@ -8,7 +8,7 @@ import pandas as pd
 import scipy.stats as stats
 import scikit_posthocs as sk
 
-from inspigtor.kernel.readers.picco2_reader import PiCCO2FileReader, PiCCO2FileReaderError
+from inspigtor.kernel.readers.picco2_reader import get_pooled_mean_std, PiCCO2FileReader, PiCCO2FileReaderError
 from inspigtor.kernel.utils.stats import statistical_functions
 
 
@@ -26,6 +26,9 @@ class PigsPool:
 
         self._pigs = collections.OrderedDict()
 
+        # The names of the pigs in insertion order, for indexed access
+        self._pig_names = []
+
     def __len__(self):
 
         return len(self._pigs)
@@ -42,11 +45,13 @@ class PigsPool:
             return
 
         self._pigs[reader.filename] = reader
+        self._pig_names.append(reader.filename)
 
     def remove_reader(self, filename):
 
         if filename in self._pigs:
             del self._pigs[filename]
+            self._pig_names.remove(filename)
 
     def get_reader(self, filename):
 
@@ -56,11 +61,11 @@ class PigsPool:
         """Check whether intervals have been defined for this pool.
         """
 
-        record = None
-        for pig in self._pigs.values():
-            record = pig.record
+        # The scan stops at the first pig without record intervals
+        if not self._pigs:
+            return False
 
-        return record is not None
+        return all(pig.record is not None for pig in self._pigs.values())
 
     def evaluate_global_time_effect(self, selected_property='APs', interval_indexes=None):
         """Performs a Friedman statistical test to check whether the averages defined for each pig over record intervals
@@ -117,16 +122,16 @@ class PigsPool:
             valid_intervals.append(i)
             valid_averages_per_interval.append(averages)
 
-        df = sk.posthoc_dunn(valid_averages_per_interval)
-        df = df.round(4)
+        # The p values are rounded on the underlying array rather than on an intermediate data frame
+        dunn_p_values = np.round(sk.posthoc_dunn(valid_averages_per_interval).to_numpy(), 4)
 
         n_times = len(timeline)
 
-        p_values = pd.DataFrame(np.full((n_times, n_times), np.nan, dtype=float), index=timeline, columns=timeline)
+        # Scatter the p values of the valid intervals into the full matrix in one go
+        p_values_matrix = np.full((n_times, n_times), np.nan, dtype=float)
+        p_values_matrix[np.ix_(valid_intervals, valid_intervals)] = dunn_p_values
 
-        for i, interv_i in enumerate(valid_intervals):
-            for j, interv_j in enumerate(valid_intervals):
-                p_values.iloc[interv_i, interv_j] = df.iloc[i, j]
+        p_values = pd.DataFrame(p_values_matrix, index=timeline, columns=timeline)
 
         return p_values
 
@@ -146,8 +151,35 @@ class PigsPool:
             PigsPoolError: if the selected statistics is not valid.
         """
 
-        n_pigs = len(self._pigs)
-        all_statistics = []
+        # An unknown statistics is reported before computing anything for the individuals
+        if selected_statistics not in statistical_functions:
+            raise PigsPoolError('The statistics {} is unknown'.format(selected_statistics))
+
+        longest_timeline = []
+        for reader in self._pigs.values():
+            timeline = reader.timeline
+            if len(timeline) > len(longest_timeline):
+                longest_timeline = timeline
+
+        # The statistics of each individual are written directly in their column of the output array
+        output = np.full((len(longest_timeline), len(self._pigs)), np.nan, dtype=float)
+
+        n_computed_statistics = 0
+
+        # The means and the standard deviations of all the individuals are computed in one go
+        if selected_statistics in ['mean', 'std']:
+            for mean_std in get_pooled_mean_std(list(self._pigs.values()), selected_property, interval_indexes):
+                if mean_std is None:
+                    continue
+                individual_statistics = mean_std[0] if selected_statistics == 'mean' else mean_std[1]
+                output[0:len(individual_statistics), n_computed_statistics] = individual_statistics
+                n_computed_statistics += 1
+
+            if n_computed_statistics == 0:
+                raise PigsPoolError('No statistics computed for pool')
+
+            return longest_timeline, output
+
         for reader in self._pigs.values():
 
             try:
@@ -157,28 +189,15 @@ class PigsPool:
                 logging.error(str(error))
                 continue
 
-            if selected_statistics not in descriptive_statistics:
-                raise PigsPoolError('The statistics {} is unknown'.format(selected_statistics))
-
             # The selected statistics over record intervals for the current individual
             individual_statistics = descriptive_statistics[selected_statistics]
 
-            all_statistics.append(individual_statistics)
+            output[0:len(individual_statistics), n_computed_statistics] = individual_statistics
+            n_computed_statistics += 1
 
-        longest_timeline = []
-        for reader in self._pigs.values():
-            timeline = reader.timeline
-            if len(timeline) > len(longest_timeline):
-                longest_timeline = timeline
-
-        if not all_statistics:
+        if n_computed_statistics == 0:
             raise PigsPoolError('No statistics computed for pool')
 
-        output = np.full((len(longest_timeline), n_pigs), np.nan, dtype=float)
-
-        for i, s in enumerate(all_statistics):
-            output[0:len(s), i] = s
-
         return longest_timeline, output
 
     def has_reader(self, filename):
@@ -209,15 +228,32 @@ class PigsPool:
         if not output_statistics:
             raise PigsPoolError('No valid output statistics')
 
+        # The statistics are reduced over the individuals (axis=1) for all the intervals in one go
         reduced_statistics = {}
+
+        # Both quartiles are computed by a single quantile call such as each interval is partitioned once for the two of them
+        if '1st quantile' in output_statistics and '3rd quantile' in output_statistics:
+            reduced_statistics['1st quantile'], reduced_statistics['3rd quantile'] = np.nanquantile(statistics, q=[0.25, 0.75], axis=1)
+
         for func in output_statistics:
-            reduced_statistics[func] = [statistical_functions[func](row) for row in statistics]
+            if func not in reduced_statistics:
+                reduced_statistics[func] = statistical_functions[func](statistics, axis=1)
 
         if not reduced_statistics:
             raise PigsPoolError('Unknown reduce statistics')
 
         return reduced_statistics
 
+    @property
+    def pig_names(self):
+        """Getter for the names of the pigs registered in the pool, in insertion order.
+
+        Returns:
+            list of str: the names of the pigs
+        """
+
+        return self._pig_names
+
     @ property
     def pigs(self):
         """Getter for self._pigs attribute.
@@ -245,10 +281,10 @@ class PigsPool:
             2-tuple: the results of the Friedman test (float) and Dunn test (pandas.DataFrame)
         """
 
-        friedman_statistics = {}
-        dunn_statistics = {}
-
-        averages = []
+        # The averages of each individual are written directly in their column of a preallocated array such as the number of rows is the
+        # number of intervals (the one before Tinitial and the n last ones) and the number of columns is the number of individuals
+        averages = np.empty((1 + max(n_last_intervals, 0), len(self._pigs)), dtype=np.float64)
+        n_individuals = 0
 
         record = None
 
@@ -268,7 +304,8 @@ class PigsPool:
                 logging.error(str(error))
                 continue
 
-            averages.append(descriptive_statistics['mean'])
+            averages[:, n_individuals] = descriptive_statistics['mean']
+            n_individuals += 1
 
         if record is None:
             logging.error('No record interval defined')
@@ -276,11 +313,10 @@ class PigsPool:
 
         times = ['t_initial'] + ['t_final ({:d})'.format(record*i) for i in range(-n_last_intervals+1, 1)]
 
-        # Transpose the nested list such as the number rows is the number of intervals and the number of columns is the number of individuals
-        averages = [list(x) for x in zip(*averages)]
+        averages = averages[:, :n_individuals]
 
         friedman_statistics = stats.friedmanchisquare(*averages).pvalue
-        data_frame = sk.posthoc_dunn(averages)
+        data_frame = sk.posthoc_dunn(list(averages))
         data_frame = data_frame.round(4)
         dunn_statistics = data_frame
 
@@ -1,4 +1,5 @@
 import collections
+import concurrent.futures
 from datetime import datetime
 import logging
 import os
@@ -10,7 +11,8 @@ import numpy as np
 
 import pandas as pd
 
-from inspigtor.kernel.utils.stats import statistical_functions
+from inspigtor.kernel.utils.progress_bar import progress_bar
+from inspigtor.kernel.utils.stats import interval_mean_std, statistical_functions
 
 
 class PiCCO2FileReaderError(Exception):
@@ -89,10 +91,13 @@ class PiCCO2FileReader:
         while not csv_file.readline().startswith('Date;Time'):
             header_size += 1
 
+        # Count the data rows, the last non-empty line being the end of recording footer
+        n_rows = sum(1 for line in csv_file if line.strip()) - 1
+
         csv_file.close()
 
-        # Read the rest of the file as a csv file
-        self._data = pd.read_csv(self._filename, sep=';', skiprows=header_size, skipfooter=1, engine='python')
+        # Read the rest of the file as a csv file. Giving the number of rows instead of skipping the footer allows to use the C parser
+        self._data = pd.read_csv(self._filename, sep=';', skiprows=header_size, nrows=n_rows)
 
         # For some files, times are not written in chronological order, so sort them before doing anything
         self._data = self._data.sort_values(by=['Time'])
@@ -113,8 +118,11 @@ class PiCCO2FileReader:
         valid_t_minus_10 = False
         delta_ts = []
         first = True
-        for i, time in enumerate(self._data['Time']):
-            delta_t = datetime.strptime(time, self._time_fmt) - t_minus_10_strptime
+        # The times are parsed once and for all, the record intervals being searched from them
+        self._times = [datetime.strptime(time, self._time_fmt) for time in self._data['Time'].to_numpy()]
+
+        for i, time in enumerate(self._times):
+            delta_t = time - t_minus_10_strptime
             # If the difference between the current time and t_zero - 10 is positive for the first time, then record the corresponding
             # index as being the reference time
             if delta_t.days >= 0:
@@ -132,8 +140,26 @@ class PiCCO2FileReader:
         # Add a column to the original data which show the delta t regarding t_zero - 10 minutes
         self._data.insert(loc=2, column='delta_t', value=delta_ts)
 
+        # The columns are fixed once the file is read, so cache them
+        self._properties = tuple(self._data.columns)
+
+        # The float values of all the properties are converted once and stored column by column in a single matrix. The values
+        # which can not be casted to a float (e.g. times) are set to NaN
+        numeric_data = self._data.apply(pd.to_numeric, errors='coerce')
+        self._numeric_data = np.asfortranarray(numeric_data.to_numpy(dtype=np.float64))
+        self._property_indexes = {prop: i for i, prop in enumerate(self._properties)}
+
         self._record_intervals = []
 
+        # The record intervals as a (n_intervals, 2) array of first and last (excluded) indexes, for vectorized computations
+        self._record_intervals_array = np.empty((0, 2), dtype=np.int64)
+
+        # The coverages per property for the current record intervals
+        self._coverages = {}
+
+        # The descriptive statistics per property and per statistic for the current record intervals
+        self._descriptive_statistics = {}
+
         self._record = None
 
     @ property
@@ -156,10 +182,21 @@ class PiCCO2FileReader:
 
         return self._filename
 
+    @ property
+    def properties(self):
+        """Property for the properties (columns) stored in the csv file.
+
+        Returns:
+            tuple of str: the properties
+        """
+
+        return self._properties
+
     def get_coverages(self, selected_property='APs'):
         """Compute the coverages for a given property.
 
         The coverage of a property is the ratio between the number of valid values over the total number of values for a given property over a given record interval.
+        The coverages are cached per property until the record intervals are redefined.
 
         Args:
             selected_property (str): the selected properrty for which the coverages will be calculated.
@@ -172,22 +209,23 @@ class PiCCO2FileReader:
             logging.warning('No record intervals defined yet')
             return []
 
-        coverages = []
-        # Compute for each record interval the average and standard deviation of the selected property
-        for interval in self._record_intervals:
-            first_index, last_index = interval
-            coverage = 0.0
-            for j in range(first_index, last_index):
-                # If the value can be casted to a float, the value is considered to be valid
-                try:
-                    _ = float(self._data[selected_property].iloc[j])
-                except ValueError:
-                    continue
-                else:
-                    coverage += 1.0
-            coverages.append(100.0*coverage/(last_index-first_index))
+        if selected_property in self._coverages:
+            return list(self._coverages[selected_property])
+
+        # If the value can be casted to a float, the value is considered to be valid. As float(nan) succeeds, the empty cells (NaN in the raw data)
+        # are valid and only the non-empty cells which could not be converted to a number (NaN in the numeric data) are invalid
+        empty_cells = self._data[selected_property].isna().to_numpy()
+        valid = empty_cells | ~np.isnan(self.get_numeric_column(selected_property))
+
+        # Compute for each record interval the ratio of valid values of the selected property from the cumulative count of valid values
+        cumulative_counts = np.concatenate(([0], np.cumsum(valid)))
+        first_indexes = self._record_intervals_array[:, 0]
+        last_indexes = self._record_intervals_array[:, 1]
+        coverages = 100.0*(cumulative_counts[last_indexes] - cumulative_counts[first_indexes])/(last_indexes - first_indexes)
 
-        return coverages
+        self._coverages[selected_property] = coverages.tolist()
+
+        return list(self._coverages[selected_property])
 
     def get_descriptive_statistics(self, selected_property='APs', selected_statistics=None, interval_indexes=None):
         """Compute the statistics for a given property for the current record intervals.
@@ -200,8 +238,8 @@ class PiCCO2FileReader:
             interval_indexes (list of int): the indexes of the record intervals to select. If None, all the record intervals will be used.
 
         Returns:
-            dict: a dictionary whose keys are the different statistics computed (e;g; average, median ...) and the values are the list of 
-            the value of the statistics over record intervals
+            dict: a dictionary whose keys are the different statistics computed (e;g; average, median ...) and the values are the arrays
+            of the value of the statistics over record intervals
         """
 
         if selected_statistics is None:
@@ -213,51 +251,98 @@ class PiCCO2FileReader:
         if not selected_statistics:
             raise PiCCO2FileReaderError('Invalid input statistics')
 
-        if selected_property not in list(self._data.columns):
+        if selected_property not in self._property_indexes:
             raise PiCCO2FileReaderError('Property {} is unknown'.format(selected_property))
 
-        # Some record intervals must have been set before
-        if not self._record_intervals:
-            raise PiCCO2FileReaderError('No record intervals defined yet')
+        intervals = self.get_record_interval_bounds()
 
         if interval_indexes is None:
             interval_indexes = list(range(len(self._record_intervals)))
 
-        statistics = {}
+        selection = np.asarray(interval_indexes, dtype=np.int64)
+
+        # The statistics are computed over all the record intervals and cached per property until the record intervals are redefined.
+        # Only the statistics which were not computed yet for the selected property are computed.
+        cached_statistics = self._descriptive_statistics.setdefault(selected_property, {})
+        missing_statistics = [stat for stat in selected_statistics if stat not in cached_statistics]
 
-        for index in interval_indexes:
-            interval = self._record_intervals[index]
-            first_index, last_index = interval
-            data = []
-            for j in range(first_index, last_index):
-                try:
-                    data.append(float(self._data[selected_property].iloc[j]))
-                except ValueError:
+        values = self.get_numeric_column(selected_property)
+
+        # The mean and the standard deviation are computed for all the intervals in one go
+        if 'mean' in missing_statistics or 'std' in missing_statistics:
+            cached_statistics['mean'], cached_statistics['std'] = interval_mean_std(values, intervals[:, 0], intervals[:, 1])
+
+        # The other statistics are computed interval per interval and written directly in their preallocated array. They are cached only
+        # once complete, such as a concurrent call never reads a partially filled array.
+        other_statistics = [stat for stat in missing_statistics if stat not in ['mean', 'std']]
+        computed_statistics = {stat: np.full(len(intervals), np.nan) for stat in other_statistics}
+
+        if other_statistics:
+            for i, (first_index, last_index) in enumerate(intervals):
+                data = values[first_index:last_index]
+                data = data[~np.isnan(data)]
+                if data.size == 0:
                     continue
+                for stat in other_statistics:
+                    computed_statistics[stat][i] = statistical_functions[stat](data)
 
-            statistics.setdefault('intervals', []).append(index)
+        cached_statistics.update(computed_statistics)
 
-            if not data:
-                statistics.setdefault('data', []).append(None)
-                for stat in selected_statistics:
-                    statistics.setdefault(stat, []).append(np.nan)
-            else:
-                statistics.setdefault('data', []).append(data)
-                for stat in selected_statistics:
-                    statistics.setdefault(stat, []).append(statistical_functions[stat](data))
+        # The selected intervals are copied out of the cache such as the caller can not alter it
+        statistics = {'intervals': list(interval_indexes)}
+        for stat in selected_statistics:
+            statistics[stat] = cached_statistics[stat][selection]
 
         return statistics
 
+    def get_numeric_column(self, selected_property):
+        """Return the values of a given property as floats.
+
+        The values which can not be casted to a float are set to NaN. The returned array is a contiguous view on the numeric matrix
+        built when reading the file.
+
+        Args:
+            selected_property (str): the selected property
+
+        Returns:
+            numpy.ndarray: the float values of the property
+        """
+
+        return self._numeric_data[:, self._property_indexes[selected_property]]
+
+    def get_record_interval_bounds(self, interval_indexes=None):
+        """Return the first and last (excluded) indexes of the record intervals.
+
+        Args:
+            interval_indexes (list of int): the indexes of the record intervals to select. If None, all the record intervals will be used.
+
+        Returns:
+            numpy.ndarray: the first and last indexes of the selected record intervals (one row per interval)
+
+        Raises:
+            PiCCO2FileReaderError: if no record intervals have been set yet
+        """
+
+        # Some record intervals must have been set before
+        if not self._record_intervals:
+            raise PiCCO2FileReaderError('No record intervals defined yet')
+
+        if interval_indexes is None:
+            return self._record_intervals_array
+
+        return self._record_intervals_array[np.asarray(interval_indexes, dtype=np.int64)]
+
     def get_t_final_index(self):
         """Return the first index whose time is superior to t_final.
         """
 
-        for index, time in enumerate(self._data['Time']):
-            delta_t = datetime.strptime(self._parameters['t_final'], self._time_fmt) - datetime.strptime(time, self._time_fmt)
-            if delta_t.days < 0:
+        t_final = datetime.strptime(self._parameters['t_final'], self._time_fmt)
+
+        for index, time in enumerate(self._times):
+            if time > t_final:
                 return index
 
-        return len(self._data['Time'])
+        return len(self._times)
 
     def set_record_interval(self, interval):
         """Set the record intervals.
@@ -266,18 +351,16 @@ class PiCCO2FileReader:
             3-tuples: the record interval. 4-tuple of the form (start,end,record).
         """
 
-        t_max = self.get_t_final_index()
+        times = self._times
 
-        t_minus_10 = datetime.strptime(self._data['Time'].iloc[self._t_minus_10_index], self._time_fmt)
+        t_max = self.get_t_final_index()
 
-        self._record_intervals = []
+        t_minus_10 = times[self._t_minus_10_index]
 
         start, end, record = interval
 
-        self._record = int(record)
-
         # The record is converted from minutes to seconds
-        self._record *= 60
+        record = int(record)*60
         # Convert strptime to timedelta for further use
         start = (datetime.strptime(start, self._time_fmt) - datetime.strptime('00:00:00', self._time_fmt)).seconds
         end = (datetime.strptime(end, self._time_fmt) - datetime.strptime('00:00:00', self._time_fmt)).seconds
@@ -287,7 +370,7 @@ class PiCCO2FileReader:
         last_record_index = None
         # Loop over the times [t0-10,end] for defining the first and last indexes (included) that falls in the running interval
         for t_index in range(self._t_minus_10_index, t_max):
-            delta_t = (datetime.strptime(self._data['Time'].iloc[t_index], self._time_fmt) - t_minus_10).seconds
+            delta_t = (times[t_index] - t_minus_10).seconds
             # We have not entered yet in the interval, skip.
             if delta_t < start:
                 continue
@@ -310,22 +393,29 @@ class PiCCO2FileReader:
         if last_record_index is None:
             last_record_index = len(self._data.index)
 
+        record_intervals = []
         starting_index = first_record_index
         delta_ts = []
         for t_index in range(first_record_index, last_record_index):
-            t0 = datetime.strptime(self._data['Time'].iloc[starting_index], self._time_fmt)
-            t1 = datetime.strptime(self._data['Time'].iloc[t_index], self._time_fmt)
-            delta_t = (t1 - t0).seconds
+            delta_t = (times[t_index] - times[starting_index]).seconds
             delta_ts.append((t_index, delta_t))
 
-            if delta_t > self._record:
+            if delta_t > record:
                 for r_index, delta_t in delta_ts:
-                    if delta_t > self._record:
-                        self._record_intervals.append((starting_index, r_index))
+                    if delta_t > record:
+                        record_intervals.append((starting_index, r_index))
                         break
                 starting_index = t_index
                 delta_ts = []
 
+        # The record intervals are searched in a worker thread while the GUI thread may read them. They are set in one go once found
+        # such as a reader never exposes a partially filled list of intervals.
+        self._record = record
+        self._record_intervals = record_intervals
+        self._record_intervals_array = np.array(record_intervals, dtype=np.int64).reshape(-1, 2)
+        self._coverages = {}
+        self._descriptive_statistics = {}
+
     @ property
     def parameters(self):
         """Returns the global parameters for the pig.
@@ -369,7 +459,9 @@ class PiCCO2FileReader:
             list of 2-tuples: the list of starting and ending time for each record interval
         """
 
-        record_times = [(self._data['Time'].iloc[start], self._data['Time'].iloc[end-1]) for start, end in self._record_intervals]
+        times = self._data['Time'].to_numpy()
+
+        record_times = [(times[start], times[end-1]) for start, end in self._record_intervals]
 
         return record_times
 
@@ -392,8 +484,10 @@ class PiCCO2FileReader:
 
         record_times = self.record_times
 
+        time = datetime.strptime(time, self._time_fmt)
+
         for index, (_, ending) in enumerate(record_times):
-            delta_t = datetime.strptime(time, self._time_fmt) - datetime.strptime(ending, self._time_fmt)
+            delta_t = time - datetime.strptime(ending, self._time_fmt)
             if delta_t.seconds == 0:
                 return index
             if delta_t.days < 0:
@@ -486,6 +580,116 @@ class PiCCO2FileReader:
             return
 
 
+def get_pooled_mean_std(readers, selected_property, interval_indexes=None):
+    """Compute the mean and the standard deviation of a property over the record intervals of several readers.
+
+    The columns of the readers are concatenated such as the record intervals of all the readers are reduced in one go.
+
+    Args:
+        readers (list of PiCCO2FileReader): the readers
+        selected_property (str): the selected property
+        interval_indexes (list of int): the indexes of the record intervals to select. If None, all the record intervals will be used.
+
+    Returns:
+        list of 2-tuple: for each reader, the means and the standard deviations over its record intervals. None for the readers whose
+        statistics could not be computed.
+    """
+
+    columns = []
+    first_indexes = []
+    last_indexes = []
+    n_intervals = []
+    offset = 0
+    for reader in readers:
+        if selected_property not in reader.properties:
+            logging.error('Property {} is unknown'.format(selected_property))
+            n_intervals.append(None)
+            continue
+
+        try:
+            intervals = reader.get_record_interval_bounds(interval_indexes)
+        except PiCCO2FileReaderError as error:
+            logging.error(str(error))
+            n_intervals.append(None)
+            continue
+
+        column = reader.get_numeric_column(selected_property)
+        columns.append(column)
+        first_indexes.append(intervals[:, 0] + offset)
+        last_indexes.append(intervals[:, 1] + offset)
+        n_intervals.append(len(intervals))
+        offset += len(column)
+
+    if not columns:
+        return n_intervals
+
+    means, stds = interval_mean_std(np.concatenate(columns), np.concatenate(first_indexes), np.concatenate(last_indexes))
+
+    mean_std = []
+    start = 0
+    for n in n_intervals:
+        if n is None:
+            mean_std.append(None)
+        else:
+            mean_std.append((means[start:start+n], stds[start:start+n]))
+            start += n
+
+    return mean_std
+
+
+def read_picco2_files(filenames, progress_callback=None):
+    """Read several PiCCO2 files concurrently.
+
+    Args:
+        filenames (list of str): the PiCCO2 files to read
+        progress_callback (callable): the function called with the number of files read so far. If None, the application progress
+            bar is updated.
+
+    Returns:
+        list of PiCCO2FileReader: the readers of the files that could be read, in the order of the input files
+    """
+
+    readers = [None]*len(filenames)
+
+    if progress_callback is None:
+        progress_bar.reset(len(filenames))
+        progress_callback = progress_bar.update
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = {executor.submit(PiCCO2FileReader, filename): i for i, filename in enumerate(filenames)}
+        for progress, future in enumerate(concurrent.futures.as_completed(futures)):
+            try:
+                readers[futures[future]] = future.result()
+            except PiCCO2FileReaderError as error:
+                logging.error(str(error))
+            finally:
+                progress_callback(progress+1)
+
+    return [reader for reader in readers if reader is not None]
+
+
+def set_record_intervals(readers, interval, progress_callback=None):
+    """Set the same record interval on several readers concurrently.
+
+    Args:
+        readers (list of PiCCO2FileReader): the readers
+        interval (3-tuple): the record interval of the form (start,end,record)
+        progress_callback (callable): the function called with the number of readers processed so far. If None, the application
+            progress bar is updated.
+    """
+
+    if progress_callback is None:
+        progress_bar.reset(len(readers))
+        progress_callback = progress_bar.update
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = [executor.submit(reader.set_record_interval, interval) for reader in readers]
+        for progress, future in enumerate(concurrent.futures.as_completed(futures)):
+            # Propagate the errors raised by the workers
+            future.result()
+            progress_callback(progress+1)
+
+
 if __name__ == '__main__':
 
     reader = PiCCO2FileReader(sys.argv[1])
@@ -1,3 +1,34 @@
+import os
+
+import numpy as np
+
+
 def build_timeline(start, record, indexes):
+    """Return the times of a sequence of record intervals.
+
+    Args:
+        start (int): the time of the interval of index 0
+        record (int): the duration of a record interval
+        indexes (sequence of int): the indexes of the intervals
+
+    Returns:
+        numpy.ndarray: the times of the intervals
+    """
+
+    return start + record*np.asarray(indexes, dtype=np.int64)
+
+
+def find_csv_files(directory):
+    """Return the csv files stored in a directory.
+
+    Hidden files and non regular files are skipped.
+
+    Args:
+        directory (str): the directory to scan
+
+    Returns:
+        list of str: the paths to the csv files
+    """
 
-    return [start+record*idx for idx in indexes]
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries if entry.name.endswith('.csv') and not entry.name.startswith('.') and entry.is_file()]
@@ -13,6 +13,10 @@ class ProgressBar:
 
         self._progress_widget = None
 
+        self._n_steps = 0
+
+        self._stride = 1
+
     def set_progress_widget(self, progress_widget):
 
         self._progress_widget = progress_widget
@@ -27,6 +31,10 @@ class ProgressBar:
         if not self._progress_widget:
             return
 
+        # The widget is refreshed at most about one hundred times per task
+        self._n_steps = n_steps
+        self._stride = max(1, n_steps // 100)
+
         try:
             self._progress_widget.setMinimum(0)
             self._progress_widget.setMaximum(n_steps)
@@ -43,6 +51,10 @@ class ProgressBar:
         if not self._progress_widget:
             return
 
+        # Skip the intermediate steps which would not change the display noticeably
+        if step % self._stride != 0 and step < self._n_steps:
+            return
+
         try:
             self._progress_widget.setValue(step)
         except AttributeError:
@@ -9,9 +9,10 @@ def skew_functor(array, nan_policy='omit', **kwargs):
     """Return the skewness value of the array
     """
 
-    skew = stats.skew(array, nan_policy=nan_policy, **kwargs)
+    # Depending on scipy version, the statistics computed with the omit nan policy may come as a masked array
+    skew = np.ma.filled(stats.skew(array, nan_policy=nan_policy, **kwargs), np.nan)
 
-    value = skew.data.item() if np.isnan(array).any() else skew
+    value = skew.item() if skew.ndim == 0 else skew
 
     return value
 
@@ -20,9 +21,137 @@ def kurtosis_functor(array, nan_policy='omit', **kwargs):
     """Return the kurtosis value of the array
     """
 
-    kurtosis = stats.kurtosis(array, nan_policy=nan_policy, **kwargs)
+    kurtosis = np.ma.filled(stats.kurtosis(array, nan_policy=nan_policy, **kwargs), np.nan)
 
-    return kurtosis
+    value = kurtosis.item() if kurtosis.ndim == 0 else kurtosis
+
+    return value
+
+
+def interval_mean_std(values, first_indexes, last_indexes):
+    """Compute the mean and the standard deviation of an array over a set of intervals.
+
+    The values are promoted to float64 before being summed whatever their dtype. NaN values are skipped. The mean and the standard
+    deviation of an interval without any valid value are set to NaN. The standard deviation (ddof=0) is computed in two passes, from
+    the deviations to the interval mean, which is as stable as np.std.
+
+    Args:
+        values (numpy.ndarray): the values (integer or floating point)
+        first_indexes (numpy.ndarray): the first index of each interval
+        last_indexes (numpy.ndarray): the last index (excluded) of each interval
+
+    Returns:
+        2-tuple of numpy.ndarray: the means and the standard deviations over the intervals
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    first_indexes = np.asarray(first_indexes, dtype=np.int64)
+    last_indexes = np.asarray(last_indexes, dtype=np.int64)
+
+    means = np.full(len(first_indexes), np.nan)
+    stds = np.full(len(first_indexes), np.nan)
+
+    lengths = last_indexes - first_indexes
+    non_empty = lengths > 0
+    if not non_empty.any():
+        return means, stds
+
+    # Gather the values of the intervals one after the other such as each interval is a contiguous segment. The intervals may overlap.
+    lengths = lengths[non_empty]
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    gather_indexes = np.repeat(first_indexes[non_empty] - offsets, lengths) + np.arange(lengths.sum())
+    segments = values[gather_indexes]
+
+    # The segmented sums are computed segment by segment so that the same values always give the same results
+    valid = ~np.isnan(segments)
+    counts = np.add.reduceat(valid, offsets, dtype=np.int64)
+    valid_segments = np.where(valid, segments, 0.0)
+    segment_means = np.add.reduceat(valid_segments, offsets, dtype=np.float64)/np.maximum(counts, 1)
+
+    # The variance is computed in a second pass from the deviations to the mean to avoid catastrophic cancellations
+    deviations = np.where(valid, segments - np.repeat(segment_means, lengths), 0.0)
+    segment_stds = np.sqrt(np.add.reduceat(deviations*deviations, offsets, dtype=np.float64)/np.maximum(counts, 1))
+
+    segment_means[counts == 0] = np.nan
+    segment_stds[counts == 0] = np.nan
+
+    means[non_empty] = segment_means
+    stds[non_empty] = segment_stds
+
+    return means, stds
+
+
+def rowwise_kruskal(values, group_sizes):
+    """Perform a Kruskal-Wallis H-test on each row of a 2D array.
+
+    The columns of the array are split into consecutive groups of observations. NaN values are omitted. The p value of a row for which
+    a group has no valid observation or whose valid observations are all identical is set to NaN.
+
+    Args:
+        values (numpy.ndarray): the observations (one test per row)
+        group_sizes (list of int): the number of columns of each group
+
+    Returns:
+        numpy.ndarray: the p value of each row
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    # The bounds of the groups are kept as is, a group being possibly empty
+    group_ends = np.cumsum(group_sizes).astype(np.int64)
+    group_starts = np.concatenate(([0], group_ends[:-1])).astype(np.int64)
+
+    # The NaN values are ranked after all the valid ones such as they do not change the ranks of the valid ones
+    valid = ~np.isnan(values)
+    ranked_values = np.where(valid, values, np.inf)
+
+    # All the rows are sorted in one go. The min and max ranks of a value are the first and last positions of its run of tied values
+    # in its sorted row, which are propagated along the runs by cumulative max (forward) and min (backward).
+    order = np.argsort(ranked_values, axis=1, kind='stable')
+    sorted_values = np.take_along_axis(ranked_values, order, axis=1)
+    positions = np.broadcast_to(np.arange(values.shape[1], dtype=np.int64), values.shape)
+    run_starts = np.ones(values.shape, dtype=bool)
+    run_starts[:, 1:] = sorted_values[:, 1:] != sorted_values[:, :-1]
+    run_ends = np.ones(values.shape, dtype=bool)
+    run_ends[:, :-1] = run_starts[:, 1:]
+    sorted_min_ranks = np.maximum.accumulate(np.where(run_starts, positions, 0), axis=1) + 1
+    sorted_max_ranks = np.minimum.accumulate(np.where(run_ends, positions, values.shape[1] - 1)[:, ::-1], axis=1)[:, ::-1] + 1
+    min_ranks = np.empty(values.shape, dtype=np.int64)
+    max_ranks = np.empty(values.shape, dtype=np.int64)
+    np.put_along_axis(min_ranks, order, sorted_min_ranks, axis=1)
+    np.put_along_axis(max_ranks, order, sorted_max_ranks, axis=1)
+
+    # The average rank of a value is the mean of its min and max ranks. Their sum is kept instead such as the ranks and their sums
+    # per group are exact integers. The number of values tied with a value is the difference between its max and min ranks + 1.
+    doubled_ranks = np.where(valid, min_ranks + max_ranks, 0)
+    n_ties = np.where(valid, max_ranks - min_ranks + 1, 1)
+
+    # The sums per group are the differences of the cumulative sums at the group bounds. Unlike np.add.reduceat, which returns the
+    # value at the offset of an empty group, this gives 0 for an empty group.
+    cumulative_counts = np.zeros((values.shape[0], values.shape[1] + 1), dtype=np.int64)
+    np.cumsum(valid, axis=1, out=cumulative_counts[:, 1:])
+    n_per_group = cumulative_counts[:, group_ends] - cumulative_counts[:, group_starts]
+    cumulative_doubled_ranks = np.zeros((values.shape[0], values.shape[1] + 1), dtype=np.int64)
+    np.cumsum(doubled_ranks, axis=1, out=cumulative_doubled_ranks[:, 1:])
+    doubled_rank_sums = cumulative_doubled_ranks[:, group_ends] - cumulative_doubled_ranks[:, group_starts]
+    n = n_per_group.sum(axis=1).astype(np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # The rank sums are promoted to float64 only when squared. Dividing by n before multiplying by 12 avoids large intermediate values.
+        ssbn = (doubled_rank_sums.astype(np.float64)**2/(4.0*n_per_group)).sum(axis=1)
+        h = 12.0*(ssbn/n)/(n + 1.0) - 3.0*(n + 1.0)
+
+        # Each group of t tied values contributes t times to the sum of t^2 - 1, hence t^3 - t. Without ties, there is no correction.
+        tie_sums = (n_ties**2 - 1).sum(axis=1)
+        if tie_sums.any():
+            h /= 1.0 - tie_sums/(n**3 - n)
+
+        p_values = stats.chi2.sf(h, len(group_sizes) - 1)
+
+    p_values[(n_per_group == 0).any(axis=1) | ~np.isfinite(h)] = np.nan
+
+    return p_values
 
 
 statistical_functions = collections.OrderedDict()
@@ -33,4 +162,4 @@ statistical_functions['1st quantile'] = lambda v, *args, **kwargs: np.nanquantil
 statistical_functions['3rd quantile'] = lambda v, *args, **kwargs: np.nanquantile(v, q=0.75, *args, **kwargs)
 statistical_functions['skew'] = lambda v, *args, **kwargs: skew_functor(v, nan_policy='omit', *args, **kwargs)
 statistical_functions['kurtosis'] = lambda v, *args, **kwargs: kurtosis_functor(v, nan_policy='omit', *args, **kwargs)
-statistical_functions['n'] = lambda a, *args, **kwargs: np.count_nonzero(~np.isnan(a))
+statistical_functions['n'] = lambda a, *args, **kwargs: np.count_nonzero(~np.isnan(a), *args, **kwargs)
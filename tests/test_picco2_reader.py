@@ -0,0 +1,182 @@
+import os
+
+import numpy as np
+
+import pytest
+
+from inspigtor.kernel.readers.picco2_reader import PiCCO2FileReader, PiCCO2FileReaderError, get_pooled_mean_std, read_picco2_files, set_record_intervals
+
+tests_dir = os.path.dirname(__file__)
+
+
+def write_picco2_file(directory, name, t_initial, t_final, source='pig1.csv'):
+    """Write a PiCCO2 file with a given t_initial and t_final from one of the test files.
+
+    The test files do not define the t_initial and t_final general parameters which are required by the reader.
+    """
+
+    with open(os.path.join(tests_dir, source), 'r') as fin:
+        lines = fin.readlines()
+
+    lines[1] = 'Weight;Height;Age;Gender;category;TD cath;BSA;PBW;PBSA;t_initial;t_final;\n'
+    lines[2] = '28;130;*;Male;Adult;PV2014L16F;1.01;30;1.03;{};{};\n'.format(t_initial, t_final)
+
+    filename = os.path.join(str(directory), name)
+    with open(filename, 'w') as fout:
+        fout.writelines(lines)
+
+    return filename
+
+
+class TestReadPicco2Files:
+
+    def test_order(self, tmp_path):
+
+        filenames = [write_picco2_file(tmp_path, 'pig{}.csv'.format(i), t_initial, '09:58:00')
+                     for i, t_initial in enumerate(['09:49:00', '09:55:00', '09:52:00', '09:50:00'])]
+
+        readers = read_picco2_files(filenames)
+
+        assert([reader.filename for reader in readers] == filenames)
+        assert([reader.parameters['t_initial'] for reader in readers] == ['09:49:00', '09:55:00', '09:52:00', '09:50:00'])
+
+    def test_bad_file(self, tmp_path):
+
+        filenames = [write_picco2_file(tmp_path, 'pig1.csv', '09:49:00', '09:58:00'),
+                     os.path.join(tests_dir, 'pig1.csv'),
+                     os.path.join(str(tmp_path), 'missing.csv'),
+                     write_picco2_file(tmp_path, 'pig2.csv', '09:50:00', '09:58:00')]
+
+        readers = read_picco2_files(filenames)
+
+        assert([reader.filename for reader in readers] == [filenames[0], filenames[3]])
+
+    def test_progress_callback(self, tmp_path):
+
+        filenames = [write_picco2_file(tmp_path, 'pig{}.csv'.format(i), '09:49:00', '09:58:00') for i in range(3)]
+        filenames.append(os.path.join(str(tmp_path), 'missing.csv'))
+
+        steps = []
+        read_picco2_files(filenames, progress_callback=steps.append)
+
+        assert(steps == [1, 2, 3, 4])
+
+    def test_same_as_reader(self, tmp_path):
+
+        filename = write_picco2_file(tmp_path, 'pig1.csv', '09:49:00', '09:58:00')
+
+        reader = read_picco2_files([filename])[0]
+        expected_reader = PiCCO2FileReader(filename)
+
+        assert(reader.properties == expected_reader.properties)
+        assert(reader.timeline == expected_reader.timeline)
+
+
+class FailingPiCCO2FileReader(PiCCO2FileReader):
+    """PiCCO2 reader whose record interval can not be set.
+    """
+
+    def set_record_interval(self, interval):
+
+        raise PiCCO2FileReaderError('Invalid record interval')
+
+
+class TestSetRecordIntervals:
+
+    def test_same_as_reader(self, tmp_path):
+
+        filenames = [write_picco2_file(tmp_path, 'pig{}.csv'.format(i), t_initial, '09:58:00')
+                     for i, t_initial in enumerate(['09:49:00', '09:55:00', '09:52:00'])]
+        readers = [PiCCO2FileReader(filename) for filename in filenames]
+
+        set_record_intervals(readers, ('00:00:00', '06:15:00', 1))
+
+        for filename, reader in zip(filenames, readers):
+            expected_reader = PiCCO2FileReader(filename)
+            expected_reader.set_record_interval(('00:00:00', '06:15:00', 1))
+            assert(reader.record_intervals)
+            assert(reader.record_intervals == expected_reader.record_intervals)
+
+    def test_progress_callback(self, tmp_path):
+
+        readers = [PiCCO2FileReader(write_picco2_file(tmp_path, 'pig{}.csv'.format(i), '09:49:00', '09:58:00')) for i in range(3)]
+
+        steps = []
+        set_record_intervals(readers, ('00:00:00', '06:15:00', 1), progress_callback=steps.append)
+
+        assert(steps == [1, 2, 3])
+
+    def test_failed_search_keeps_intervals(self, tmp_path):
+
+        reader = PiCCO2FileReader(write_picco2_file(tmp_path, 'pig1.csv', '09:49:00', '09:58:00'))
+        reader.set_record_interval(('00:00:00', '06:15:00', 1))
+        record_intervals = reader.record_intervals
+
+        with pytest.raises(ValueError):
+            set_record_intervals([reader], ('00:00:00', '06:15:00', 'one'))
+
+        assert(reader.record_intervals == record_intervals)
+
+    def test_worker_error(self, tmp_path):
+
+        readers = [PiCCO2FileReader(write_picco2_file(tmp_path, 'pig{}.csv'.format(i), '09:49:00', '09:58:00')) for i in range(3)]
+
+        with pytest.raises(ValueError):
+            set_record_intervals(readers, ('00:00:00', '06:15:00', 'one'))
+
+        with pytest.raises(ValueError):
+            set_record_intervals(readers, ('00:00', '06:15:00', 1))
+
+        filename = write_picco2_file(tmp_path, 'pig3.csv', '09:49:00', '09:58:00')
+        readers.insert(1, FailingPiCCO2FileReader(filename))
+
+        with pytest.raises(PiCCO2FileReaderError):
+            set_record_intervals(readers, ('00:00:00', '06:15:00', 1))
+
+
+class TestGetPooledMeanStd:
+
+    def setup_method(self):
+
+        self._intervals = ('00:00:00', '06:15:00', 1)
+
+    def build_readers(self, directory):
+
+        readers = [PiCCO2FileReader(write_picco2_file(directory, 'pig{}.csv'.format(i), t_initial, '09:58:00'))
+                   for i, t_initial in enumerate(['09:49:00', '09:55:00', '09:52:00'])]
+        set_record_intervals(readers, self._intervals)
+
+        return readers
+
+    def check_readers(self, readers, selected_property, interval_indexes=None):
+
+        mean_std = get_pooled_mean_std(readers, selected_property, interval_indexes)
+        assert(len(mean_std) == len(readers))
+        for reader, (means, stds) in zip(readers, mean_std):
+            statistics = reader.get_descriptive_statistics(selected_property, ['mean', 'std'], interval_indexes)
+            np.testing.assert_allclose(means, statistics['mean'], rtol=1.0e-9, equal_nan=True)
+            np.testing.assert_allclose(stds, statistics['std'], rtol=1.0e-9, equal_nan=True)
+
+    def test_same_as_reader(self, tmp_path):
+
+        readers = self.build_readers(tmp_path)
+
+        for selected_property in ['APs', 'HR', 'PCCO', 'CVP']:
+            self.check_readers(readers, selected_property)
+
+    def test_interval_indexes(self, tmp_path):
+
+        readers = self.build_readers(tmp_path)
+
+        self.check_readers(readers, 'APs', [0, 2, 5])
+
+    def test_invalid_readers(self, tmp_path):
+
+        readers = self.build_readers(tmp_path)
+        readers.insert(1, PiCCO2FileReader(write_picco2_file(tmp_path, 'pig3.csv', '09:49:00', '09:58:00')))
+
+        mean_std = get_pooled_mean_std(readers, 'APs')
+        assert(mean_std[1] is None)
+        self.check_readers(readers[:1] + readers[2:], 'APs')
+
+        assert(get_pooled_mean_std(readers, 'XXX') == [None]*len(readers))
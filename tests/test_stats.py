@@ -0,0 +1,144 @@
+import math
+
+import numpy as np
+
+import scipy.stats as stats
+
+from inspigtor.kernel.utils.stats import interval_mean_std, rowwise_kruskal
+
+tolerance = 1.0e-6
+
+
+def scipy_kruskal(row, group_sizes):
+    """Return the p value of scipy Kruskal-Wallis test with the NaN policy of rowwise_kruskal.
+    """
+
+    bounds = np.cumsum([0] + list(group_sizes))
+    groups = [row[bounds[i]:bounds[i+1]] for i in range(len(group_sizes))]
+    groups = [g[~np.isnan(g)] for g in groups]
+
+    if any(len(g) == 0 for g in groups):
+        return np.nan
+
+    try:
+        return stats.kruskal(*groups).pvalue
+    except ValueError:
+        # scipy raises when all the values are identical
+        return np.nan
+
+
+class TestIntervalMeanStd:
+
+    def setup_method(self):
+
+        self._rng = np.random.default_rng(0)
+
+    def check_intervals(self, values, first_indexes, last_indexes):
+
+        means, stds = interval_mean_std(values, first_indexes, last_indexes)
+        assert(means.shape == (len(first_indexes),))
+        assert(stds.shape == (len(first_indexes),))
+        for first_index, last_index, mean, std in zip(first_indexes, last_indexes, means, stds):
+            interval_values = np.asarray(values[first_index:last_index], dtype=np.float64)
+            if np.isnan(interval_values).all():
+                assert(np.isnan(mean))
+                assert(np.isnan(std))
+            else:
+                assert(math.isclose(mean, np.nanmean(interval_values), rel_tol=tolerance, abs_tol=tolerance))
+                assert(math.isclose(std, np.nanstd(interval_values), rel_tol=tolerance, abs_tol=tolerance))
+
+    def test_contiguous_intervals(self):
+
+        values = self._rng.normal(loc=100.0, size=100)
+        values[self._rng.random(100) < 0.2] = np.nan
+        self.check_intervals(values, [0, 10, 30, 60], [10, 30, 60, 100])
+
+    def test_overlapping_intervals(self):
+
+        values = self._rng.normal(size=100)
+        values[self._rng.random(100) < 0.2] = np.nan
+        self.check_intervals(values, [0, 5, 5, 20, 50], [30, 25, 10, 80, 51])
+
+    def test_empty_intervals(self):
+
+        values = self._rng.normal(size=20)
+        means, stds = interval_mean_std(values, [0, 5, 10], [5, 5, 20])
+        assert(np.isnan(means[1]))
+        assert(np.isnan(stds[1]))
+        self.check_intervals(values, [0, 10], [5, 20])
+
+        means, stds = interval_mean_std(values, [3, 7], [3, 7])
+        assert(np.isnan(means).all())
+        assert(np.isnan(stds).all())
+
+    def test_all_nan_intervals(self):
+
+        values = self._rng.normal(size=30)
+        values[10:20] = np.nan
+        self.check_intervals(values, [0, 10, 12, 15], [10, 20, 18, 30])
+
+    def test_integer_values(self):
+
+        for dtype in [np.int8, np.int32, np.int64, np.uint16]:
+            values = self._rng.integers(0, 100, size=50).astype(dtype)
+            self.check_intervals(values, [0, 10, 5, 40], [10, 40, 45, 50])
+
+
+class TestRowwiseKruskal:
+
+    def setup_method(self):
+
+        self._rng = np.random.default_rng(0)
+
+    def check_rows(self, values, group_sizes):
+
+        p_values = rowwise_kruskal(values, group_sizes)
+        assert(p_values.shape == (values.shape[0],))
+        for row, p_value in zip(values, p_values):
+            expected = scipy_kruskal(row, group_sizes)
+            if np.isnan(expected):
+                assert(np.isnan(p_value))
+            else:
+                assert(math.isclose(p_value, expected, rel_tol=tolerance, abs_tol=tolerance))
+
+    def test_no_ties(self):
+
+        values = self._rng.normal(size=(50, 12))
+        self.check_rows(values, [4, 3, 5])
+
+    def test_ties(self):
+
+        values = self._rng.integers(0, 4, size=(200, 12)).astype(np.float64)
+        self.check_rows(values, [4, 3, 5])
+
+    def test_nan(self):
+
+        values = self._rng.integers(0, 6, size=(200, 12)).astype(np.float64)
+        values[self._rng.random(values.shape) < 0.25] = np.nan
+        self.check_rows(values, [4, 3, 5])
+
+    def test_all_equal_rows(self):
+
+        values = np.full((3, 6), 2.0)
+        values[1, 0] = np.nan
+
+        p_values = rowwise_kruskal(values, [2, 2, 2])
+        assert(np.isnan(p_values).all())
+
+    def test_all_nan_group(self):
+
+        values = self._rng.normal(size=(2, 6))
+        values[0, 2:4] = np.nan
+
+        p_values = rowwise_kruskal(values, [2, 2, 2])
+        assert(np.isnan(p_values[0]))
+        self.check_rows(values, [2, 2, 2])
+
+    def test_empty_group(self):
+
+        assert(np.isnan(rowwise_kruskal([[1.0, 2.0, 3.0, 4.0]], [2, 0, 2])[0]))
+        assert(np.isnan(rowwise_kruskal([[1.0, 2.0, 3.0, 4.0]], [0, 2, 2])[0]))
+        assert(np.isnan(rowwise_kruskal([[1.0, 2.0, 3.0, 4.0]], [2, 2, 0])[0]))
+
+        values = self._rng.normal(size=(20, 8))
+        self.check_rows(values, [3, 0, 5])